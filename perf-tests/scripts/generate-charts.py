@@ -8,23 +8,44 @@ Arguments:
   results_dir  Directory containing raw test results
   timestamp    Optional timestamp for output filenames (format: YYYYMMDD-HHMMSS)
 
+Environment:
+  CHART_DPI       Resolution of the static PNG charts (default: 100)
+  CHART_PLOTLYJS  How the HTML dashboards load plotly.js: 'cdn' (default),
+                  'directory' (shared plotly-<version>.min.js next to the
+                  HTML files for offline viewing) or 'inline' (embedded in
+                  each file)
+
 Generates:
 - Static PNG charts using matplotlib (for reports/documentation)
 - Interactive HTML dashboard using plotly (for browser viewing)
 - Time-series charts showing per-minute metric data
 """
 
-import json
+from __future__ import annotations
+
+import contextlib
+import gc
+import io
+import mmap
+import multiprocessing
 import os
 import sys
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
+import matplotlib
+matplotlib.use('Agg')  # Non-interactive raster backend; must be selected before pyplot is imported
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
+from matplotlib.figure import Figure
+import numpy as np
+import orjson
 import pandas as pd
 import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.offline import get_plotlyjs, get_plotlyjs_version
 from plotly.subplots import make_subplots
 
 # Color palette - vibrant, distinct colors
@@ -59,16 +80,107 @@ plt.rcParams.update({
 })
 
 
+# PNG resolution; rasterization and encoding cost scale with the pixel count
+DPI = int(os.environ.get('CHART_DPI', '100'))
+
+# How the dashboards load plotly.js; main() rejects anything else
+PLOTLYJS_MODES = ('cdn', 'directory', 'inline')
+PLOTLYJS = os.environ.get('CHART_PLOTLYJS', 'cdn')
+
+# Figures are cached per size and cleared between charts instead of being recreated.
+# Constrained layout fits titles, labels and legends in a single pass while drawing.
+_FIGURES: dict[tuple[float, float], Figure] = {}
+
+
+def reusable_fig(figsize: tuple[float, float]) -> Figure:
+    """Return an empty figure of the given size, reusing a previously created one."""
+    fig = _FIGURES.get(figsize)
+    if fig is None:
+        fig = _FIGURES[figsize] = plt.figure(figsize=figsize, layout='constrained')
+    else:
+        fig.clear()
+    return fig
+
+
+def save_chart(fig: Figure, output_path: Path) -> None:
+    """Save a chart as PNG; reusable_fig clears the figure when it is next reused."""
+    fig.savefig(output_path, dpi=DPI, metadata={},
+                pil_kwargs={'optimize': False, 'compress_level': 1})
+    print(f"  ✅ Created: {output_path}", flush=True)
+
+
+def bar_value_labels(values: pd.Series, fmt: str) -> list[str]:
+    """Format bar heights for ax.bar_label, leaving non-positive bars unlabelled."""
+    return [format(v, fmt) if v > 0 else '' for v in values]
+
+
+def text_labels(values: np.ndarray, decimals: int) -> list[str]:
+    """Format values as fixed-point strings for plotly bar text."""
+    return [f"{v:.{decimals}f}" for v in values.tolist()]
+
+
+def percent_of(actual: pd.Series | np.ndarray, target: pd.Series | np.ndarray, fill: float = 0.0) -> np.ndarray:
+    """Return actual as a percentage of target, using fill where target is not positive."""
+    actual = np.asarray(actual, dtype=np.float64)
+    target = np.asarray(target, dtype=np.float64)
+    valid = target > 0
+    return np.where(valid, actual / np.where(valid, target, 1.0) * 100.0, fill)
+
+
+# Most charts queued at once: the static phase. More workers than this would sit idle.
+MAX_CHART_JOBS = 10
+
+
+def chart_pool() -> ProcessPoolExecutor:
+    """Create the worker pool that renders PNG charts.
+
+    Workers come from a forkserver where the platform has one, so they are
+    never forked from the main process while it is building figures or
+    pickling frames for the pool.
+    """
+    method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else None
+    return ProcessPoolExecutor(max_workers=min(MAX_CHART_JOBS, os.cpu_count() or 1),
+                               mp_context=multiprocessing.get_context(method))
+
+
+def _run_chart(chart: Callable[..., None], args: tuple) -> str:
+    """Render one chart in a worker and return its progress output instead of printing it."""
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        chart(*args)
+    return out.getvalue()
+
+
+def render_charts(pool: Executor, charts: list[tuple[Callable[..., None], tuple]]) -> list[Future]:
+    """Queue independent charts on a pool of worker processes.
+
+    Rasterization is CPU-bound, so each (chart function, arguments) pair is
+    run in a worker process rather than one after another. The caller keeps
+    working while the charts render and then passes the returned futures to
+    wait_for_charts.
+    """
+    return [pool.submit(_run_chart, chart, args) for chart, args in charts]
+
+
+def wait_for_charts(pending: list[Future]) -> None:
+    """Wait for queued charts in submission order, printing each one's progress output.
+
+    Workers do not print themselves, so chart lines come out in a fixed order
+    instead of interleaving with the main process output.
+    """
+    for future in pending:
+        print(future.result(), end='', flush=True)
+
+
 def load_report_metadata(results_dir: Path) -> dict[str, Any]:
     """Load the most recent report file to get metadata."""
-    report_files = sorted(results_dir.glob('report-*.json'), reverse=True)
-    if report_files:
-        try:
-            with open(report_files[0]) as f:
-                report = json.load(f)
-                return report.get('report_metadata', {})
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Warning: Could not parse report file: {e}")
+    latest = max(results_dir.glob('report-*.json'), key=lambda p: p.name, default=None)
+    if latest is None:
+        return {}
+    try:
+        return orjson.loads(latest.read_bytes()).get('report_metadata', {})
+    except (orjson.JSONDecodeError, IOError) as e:
+        print(f"Warning: Could not parse report file: {e}")
     return {}
 
 
@@ -90,6 +202,28 @@ def get_report_name(metadata: dict[str, Any]) -> str:
     return "Tempo Performance Test"
 
 
+# Raw files larger than this are memory-mapped instead of read into a bytes copy
+MMAP_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+
+def _read_json(json_file: Path) -> Any:
+    """Decode a JSON file from one contiguous buffer."""
+    if json_file.stat().st_size <= MMAP_THRESHOLD_BYTES:
+        return orjson.loads(json_file.read_bytes())
+    with json_file.open('rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as buf:
+            return orjson.loads(buf)
+
+
+def _load_one(json_file: Path) -> dict[str, Any] | None:
+    """Parse a single raw result file, returning None if it is not valid JSON."""
+    try:
+        return _read_json(json_file)
+    except orjson.JSONDecodeError as e:
+        print(f"Warning: Could not parse {json_file}: {e}")
+        return None
+
+
 def load_test_results(results_dir: Path) -> list[dict[str, Any]]:
     """Load all test results from raw JSON files."""
     raw_dir = results_dir / 'raw'
@@ -97,15 +231,10 @@ def load_test_results(results_dir: Path) -> list[dict[str, Any]]:
         print(f"Error: Raw results directory not found: {raw_dir}")
         sys.exit(1)
 
-    results = []
-    for json_file in sorted(raw_dir.glob('*.json')):
-        try:
-            with open(json_file) as f:
-                data = json.load(f)
-                results.append(data)
-        except json.JSONDecodeError as e:
-            print(f"Warning: Could not parse {json_file}: {e}")
-            continue
+    # orjson releases the GIL while parsing, so reads and parses overlap across threads
+    paths = sorted(raw_dir.glob('*.json'), key=lambda p: p.name)
+    with ThreadPoolExecutor(max_workers=max(1, min(32, len(paths)))) as ex:
+        results = [data for data in ex.map(_load_one, paths) if data is not None]
 
     if not results:
         print(f"Error: No valid JSON files found in {raw_dir}")
@@ -114,80 +243,137 @@ def load_test_results(results_dir: Path) -> list[dict[str, Any]]:
     return results
 
 
+# Flattened JSON field -> summary column; fields missing from a result default to 0
+RESULT_FIELDS = {
+    'config.mb_per_sec': 'mb_per_sec',  # Target rate from config
+    'config.target_qps': 'target_qps',
+    'metrics.throughput.bytes_per_second': 'bytes_per_sec',  # Actual measured value
+    'metrics.throughput.spans_per_second': 'spans_per_sec',
+    'metrics.query_latencies.p50_seconds': 'p50_ms',
+    'metrics.query_latencies.p90_seconds': 'p90_ms',
+    'metrics.query_latencies.p99_seconds': 'p99_ms',
+    'metrics.query_latencies.avg_seconds': 'avg_latency_ms',
+    'metrics.resources.avg_cpu_cores': 'cpu_cores',
+    'metrics.resources.max_cpu_cores': 'max_cpu_cores',
+    'metrics.resources.min_cpu_cores': 'min_cpu_cores',
+    'metrics.resources.sustained_cpu_cores': 'sustained_cpu',
+    'metrics.resources.avg_memory_gb': 'avg_memory_gb',
+    'metrics.resources.max_memory_gb': 'max_memory_gb',
+    'metrics.resources.min_memory_gb': 'min_memory_gb',
+    'metrics.resources.peak_memory_gb': 'peak_memory_gb',
+    'metrics.resource_recommendations.cpu_cores': 'recommended_cpu',
+    'metrics.resource_recommendations.memory_gb': 'recommended_memory_gb',
+    'metrics.errors.error_rate_percent': 'error_rate',
+    'metrics.errors.dropped_spans_per_second': 'dropped_spans',
+    'metrics.errors.discarded_spans_per_second': 'discarded_spans',
+    'metrics.query_results.avg_spans_returned': 'avg_spans_returned',
+    'metrics.query_results.actual_qps': 'actual_qps',
+}
+
+SUMMARY_COLUMNS = [
+    'load_name', 'mb_per_sec', 'mb_per_sec_actual', 'gb_per_day', 'bytes_per_sec',
+    'p50_ms', 'p90_ms', 'p99_ms', 'avg_latency_ms',
+    'cpu_cores', 'cpu_millicores', 'max_cpu_cores', 'max_cpu_millicores',
+    'min_cpu_cores', 'min_cpu_millicores',
+    'avg_memory_gb', 'memory_gb', 'max_memory_gb', 'min_memory_gb',
+    'sustained_cpu', 'sustained_cpu_millicores', 'peak_memory_gb',
+    'recommended_cpu', 'recommended_cpu_millicores', 'recommended_memory_gb',
+    'spans_per_sec', 'error_rate', 'dropped_spans', 'discarded_spans',
+    'avg_spans_returned', 'actual_qps', 'target_qps',
+]
+
+
+# Summary metrics whose precision needs no more than float32. mb_per_sec stays as
+# configured because chart labels print it verbatim (5 MB/s, not 5.0 MB/s).
+FLOAT32_COLUMNS = [
+    'p50_ms', 'p90_ms', 'p99_ms', 'cpu_cores', 'memory_gb', 'spans_per_sec', 'error_rate',
+    'dropped_spans', 'mb_per_sec_actual', 'bytes_per_sec',
+]
+
+
 def results_to_dataframe(results: list[dict[str, Any]]) -> pd.DataFrame:
     """Convert test results to a pandas DataFrame."""
-    rows = []
-    for r in results:
-        # Get bytes_per_second from metrics (actual measured value)
-        bytes_per_sec = r.get('metrics', {}).get('throughput', {}).get('bytes_per_second', 0)
-        mb_per_sec_actual = bytes_per_sec / (1024 * 1024) if bytes_per_sec else 0
-        
-        # Get CPU values in cores and convert to millicores
-        resources = r.get('metrics', {}).get('resources', {})
-        cpu_cores = resources.get('avg_cpu_cores', 0)
-        max_cpu_cores = resources.get('max_cpu_cores', 0)
-        min_cpu_cores = resources.get('min_cpu_cores', 0)
-        sustained_cpu_cores = resources.get('sustained_cpu_cores', 0)
-        recommended_cpu_cores = r.get('metrics', {}).get('resource_recommendations', {}).get('cpu_cores', 0)
-        
-        # Get memory values
-        avg_memory_gb = resources.get('avg_memory_gb', 0)
-        max_memory_gb = resources.get('max_memory_gb', 0)
-        min_memory_gb = resources.get('min_memory_gb', 0)
-        
-        # Calculate GB per day from actual MB/s: MB/s * 86400 seconds/day / 1024 MB/GB
-        gb_per_day = mb_per_sec_actual * 86400 / 1024 if mb_per_sec_actual else 0
-        
-        # Get actual QPS from query results
-        actual_qps = r.get('metrics', {}).get('query_results', {}).get('actual_qps', 0)
-        # Get target QPS from config
-        target_qps = r.get('config', {}).get('target_qps', 0)
-        
-        row = {
-            'load_name': r.get('load_name', 'unknown'),
-            'mb_per_sec': r.get('config', {}).get('mb_per_sec', 0),  # Target rate from config
-            'mb_per_sec_actual': mb_per_sec_actual,  # Actual measured rate
-            'gb_per_day': gb_per_day,  # Daily data volume in GB
-            'bytes_per_sec': bytes_per_sec,
-            'p50_ms': r.get('metrics', {}).get('query_latencies', {}).get('p50_seconds', 0) * 1000,
-            'p90_ms': r.get('metrics', {}).get('query_latencies', {}).get('p90_seconds', 0) * 1000,
-            'p99_ms': r.get('metrics', {}).get('query_latencies', {}).get('p99_seconds', 0) * 1000,
-            'avg_latency_ms': r.get('metrics', {}).get('query_latencies', {}).get('avg_seconds', 0) * 1000,
-            'cpu_cores': cpu_cores,
-            'cpu_millicores': cpu_cores * 1000,  # Convert to millicores
-            'max_cpu_cores': max_cpu_cores,
-            'max_cpu_millicores': max_cpu_cores * 1000,  # Convert to millicores
-            'min_cpu_cores': min_cpu_cores,
-            'min_cpu_millicores': min_cpu_cores * 1000,  # Convert to millicores
-            'avg_memory_gb': avg_memory_gb,
-            'memory_gb': max_memory_gb,  # Keep for backward compatibility
-            'max_memory_gb': max_memory_gb,
-            'min_memory_gb': min_memory_gb,
-            'sustained_cpu': sustained_cpu_cores,
-            'sustained_cpu_millicores': sustained_cpu_cores * 1000,  # Convert to millicores
-            'peak_memory_gb': r.get('metrics', {}).get('resources', {}).get('peak_memory_gb', 0),
-            'recommended_cpu': recommended_cpu_cores,
-            'recommended_cpu_millicores': recommended_cpu_cores * 1000,  # Convert to millicores
-            'recommended_memory_gb': r.get('metrics', {}).get('resource_recommendations', {}).get('memory_gb', 0),
-            'spans_per_sec': r.get('metrics', {}).get('throughput', {}).get('spans_per_second', 0),
-            'error_rate': r.get('metrics', {}).get('errors', {}).get('error_rate_percent', 0),
-            'dropped_spans': r.get('metrics', {}).get('errors', {}).get('dropped_spans_per_second', 0),
-            'discarded_spans': r.get('metrics', {}).get('errors', {}).get('discarded_spans_per_second', 0),
-            'avg_spans_returned': r.get('metrics', {}).get('query_results', {}).get('avg_spans_returned', 0),
-            'actual_qps': actual_qps,
-            'target_qps': target_qps,
-        }
-        rows.append(row)
-
-    df = pd.DataFrame(rows)
+    raw = pd.json_normalize(results, max_level=3)
+    df = raw.reindex(columns=list(RESULT_FIELDS), fill_value=0).rename(columns=RESULT_FIELDS)
+    df = df.fillna(0)
+    # A missing rate leaves the column float; restore integer configs so labels read 5 MB/s, not 5.0
+    if all(isinstance(r.get('config', {}).get('mb_per_sec', 0), int) for r in results):
+        df['mb_per_sec'] = df['mb_per_sec'].astype('int64')
+    df['load_name'] = raw['load_name'].fillna('unknown') if 'load_name' in raw else 'unknown'
+
+    # Latencies are reported in seconds
+    df[['p50_ms', 'p90_ms', 'p99_ms', 'avg_latency_ms']] *= 1000
+
+    df['mb_per_sec_actual'] = df['bytes_per_sec'] / (1024 * 1024)
+    # Calculate GB per day from actual MB/s: MB/s * 86400 seconds/day / 1024 MB/GB
+    df['gb_per_day'] = df['mb_per_sec_actual'] * 86400 / 1024
+
+    # Convert CPU values in cores to millicores
+    for col, cores in [('cpu_millicores', 'cpu_cores'), ('max_cpu_millicores', 'max_cpu_cores'),
+                       ('min_cpu_millicores', 'min_cpu_cores'),
+                       ('sustained_cpu_millicores', 'sustained_cpu'),
+                       ('recommended_cpu_millicores', 'recommended_cpu')]:
+        df[col] = df[cores] * 1000
+
+    df['memory_gb'] = df['max_memory_gb']  # Keep for backward compatibility
+
+    df = df[SUMMARY_COLUMNS]
     # Sort by MB/s for consistent ordering
     df = df.sort_values('mb_per_sec').reset_index(drop=True)
+    # Derived columns are computed above in float64; only storage is narrowed
+    df = df.astype({c: 'float32' for c in FLOAT32_COLUMNS})
     return df
 
 
+# Raw timeseries key -> DataFrame column; CPU comes first as it is the timestamp reference
+TIMESERIES_METRICS = {
+    'cpu_cores': 'cpu_cores',
+    'memory_gb': 'memory_gb',
+    'spans_per_second': 'spans_per_sec',
+    'bytes_per_second': 'bytes_per_sec',
+    'p50_latency_seconds': 'p50_ms',
+    'p90_latency_seconds': 'p90_ms',
+    'p99_latency_seconds': 'p99_ms',
+    'query_failures_per_second': 'query_failures',
+    'dropped_spans_per_second': 'dropped_spans',
+    'discarded_spans_per_second': 'discarded_spans',
+    'avg_spans_returned': 'avg_spans_returned',
+    'qps': 'qps',
+}
+
+TIMESERIES_COLUMNS = [
+    'load_name', 'timestamp', 'datetime', 'cpu_cores', 'cpu_millicores', 'memory_gb',
+    'spans_per_sec', 'bytes_per_sec', 'mb_per_sec_ts', 'p50_ms', 'p90_ms', 'p99_ms',
+    'query_failures', 'dropped_spans', 'discarded_spans', 'avg_spans_returned',
+    'qps', 'target_qps',
+]
+
+
+def _series_arrays(samples: list[dict[str, Any]]) -> tuple[np.ndarray, np.ndarray]:
+    """Convert [{timestamp, value}, ...] samples to sorted, de-duplicated arrays.
+
+    When a timestamp repeats, the last sample wins.
+    """
+    count = len(samples)
+    ts = np.fromiter((item['timestamp'] for item in samples), dtype=np.int64, count=count)
+    values = np.fromiter((item['value'] for item in samples), dtype=np.float32, count=count)
+    # np.unique keeps the first occurrence, so search the reversed arrays
+    ts, idx = np.unique(ts[::-1], return_index=True)
+    return ts, values[::-1][idx]
+
+
+def _align_series(samples: list[dict[str, Any]], ref_ts: np.ndarray) -> np.ndarray:
+    """Look up a metric's values at the reference timestamps, using 0 where it has no sample."""
+    if not samples:
+        return np.zeros(len(ref_ts), dtype=np.float32)
+    ts, values = _series_arrays(samples)
+    pos = np.minimum(np.searchsorted(ts, ref_ts), len(ts) - 1)
+    return np.where(ts[pos] == ref_ts, values[pos], np.float32(0))
+
+
 def extract_timeseries_data(results: list[dict[str, Any]]) -> pd.DataFrame:
     """Extract time-series data from test results into a DataFrame."""
-    rows = []
+    frames = []
     
     for r in results:
         load_name = r.get('load_name', 'unknown')
@@ -197,57 +383,35 @@ def extract_timeseries_data(results: list[dict[str, Any]]) -> pd.DataFrame:
         if not timeseries or not timeseries.get('cpu_cores'):
             continue
         
-        # Get target QPS from config for this load
-        target_qps = r.get('config', {}).get('target_qps', 0)
-        
-        # Get all timeseries arrays
-        cpu_data = {item['timestamp']: item['value'] for item in timeseries.get('cpu_cores', [])}
-        memory_data = {item['timestamp']: item['value'] for item in timeseries.get('memory_gb', [])}
-        spans_data = {item['timestamp']: item['value'] for item in timeseries.get('spans_per_second', [])}
-        bytes_data = {item['timestamp']: item['value'] for item in timeseries.get('bytes_per_second', [])}
-        p50_data = {item['timestamp']: item['value'] for item in timeseries.get('p50_latency_seconds', [])}
-        p90_data = {item['timestamp']: item['value'] for item in timeseries.get('p90_latency_seconds', [])}
-        p99_data = {item['timestamp']: item['value'] for item in timeseries.get('p99_latency_seconds', [])}
-        failures_data = {item['timestamp']: item['value'] for item in timeseries.get('query_failures_per_second', [])}
-        dropped_data = {item['timestamp']: item['value'] for item in timeseries.get('dropped_spans_per_second', [])}
-        discarded_data = {item['timestamp']: item['value'] for item in timeseries.get('discarded_spans_per_second', [])}
-        spans_returned_data = {item['timestamp']: item['value'] for item in timeseries.get('avg_spans_returned', [])}
-        qps_data = {item['timestamp']: item['value'] for item in timeseries.get('qps', [])}
-        
-        # Use CPU timestamps as reference
-        for ts in sorted(cpu_data.keys()):
-            cpu_val = cpu_data.get(ts, 0)
-            rows.append({
-                'load_name': load_name,
-                'timestamp': ts,
-                'datetime': datetime.fromtimestamp(ts),
-                'cpu_cores': cpu_val,
-                'cpu_millicores': cpu_val * 1000,  # Convert to millicores
-                'memory_gb': memory_data.get(ts, 0),
-                'spans_per_sec': spans_data.get(ts, 0),
-                'bytes_per_sec': bytes_data.get(ts, 0),
-                'p50_ms': p50_data.get(ts, 0) * 1000,
-                'p90_ms': p90_data.get(ts, 0) * 1000,
-                'p99_ms': p99_data.get(ts, 0) * 1000,
-                'query_failures': failures_data.get(ts, 0),
-                'dropped_spans': dropped_data.get(ts, 0),
-                'discarded_spans': discarded_data.get(ts, 0),
-                'avg_spans_returned': spans_returned_data.get(ts, 0),
-                'qps': qps_data.get(ts, 0),
-                'target_qps': target_qps,
-            })
-    
-    if not rows:
+        # Use CPU timestamps as reference; samples missing from other metrics become 0
+        ref_ts, _ = _series_arrays(timeseries['cpu_cores'])
+        columns = {
+            column: _align_series(timeseries.get(key) or [], ref_ts)
+            for key, column in TIMESERIES_METRICS.items()
+        }
+        frames.append(pd.DataFrame({
+            'load_name': load_name,
+            'timestamp': ref_ts,
+            **columns,
+            # Get target QPS from config for this load
+            'target_qps': r.get('config', {}).get('target_qps', 0),
+        }))
+    
+    if not frames:
         return pd.DataFrame()
     
-    df = pd.DataFrame(rows)
+    df = pd.concat(frames, ignore_index=True)
+    df['datetime'] = pd.to_datetime(df['timestamp'], unit='s', cache=True)
+    df['cpu_millicores'] = df['cpu_cores'] * 1000  # Convert to millicores
+    df['mb_per_sec_ts'] = df['bytes_per_sec'] * (1 / 1048576)  # Convert to MB/sec
+    df[['p50_ms', 'p90_ms', 'p99_ms']] *= 1000
+    df = df[TIMESERIES_COLUMNS]
+    
     df = df.sort_values(['load_name', 'timestamp']).reset_index(drop=True)
     
     # Add relative minute column per load
-    for load in df['load_name'].unique():
-        mask = df['load_name'] == load
-        min_ts = df.loc[mask, 'timestamp'].min()
-        df.loc[mask, 'minute'] = ((df.loc[mask, 'timestamp'] - min_ts) / 60).astype(int) + 1
+    start_ts = df.groupby('load_name')['timestamp'].transform('min')
+    df['minute'] = ((df['timestamp'] - start_ts) // 60 + 1).astype('int64')
     
     return df
 
@@ -256,54 +420,48 @@ def extract_timeseries_data(results: list[dict[str, Any]]) -> pd.DataFrame:
 # Static Chart Generation (matplotlib)
 # =============================================================================
 
-def create_latency_chart(df: pd.DataFrame, output_dir: Path, report_name: str, timestamp: str) -> None:
+def create_latency_chart(df: pd.DataFrame, xt_labels: list[str], output_dir: Path, report_name: str, timestamp: str) -> None:
     """Create latency comparison bar chart."""
-    fig, ax = plt.subplots(figsize=(12, 7))
+    fig = reusable_fig((12, 7))
+    ax = fig.subplots()
 
-    x = range(len(df))
+    x = np.arange(len(df))
     width = 0.25
 
-    bars1 = ax.bar([i - width for i in x], df['p50_ms'], width,
+    bars1 = ax.bar(x - width, df['p50_ms'].to_numpy(), width,
                    label='P50', color=COLORS['primary'], edgecolor='white', linewidth=0.5)
-    bars2 = ax.bar(x, df['p90_ms'], width,
+    bars2 = ax.bar(x, df['p90_ms'].to_numpy(), width,
                    label='P90', color=COLORS['secondary'], edgecolor='white', linewidth=0.5)
-    bars3 = ax.bar([i + width for i in x], df['p99_ms'], width,
+    bars3 = ax.bar(x + width, df['p99_ms'].to_numpy(), width,
                    label='P99', color=COLORS['tertiary'], edgecolor='white', linewidth=0.5)
 
     ax.set_xlabel('Load Configuration', fontsize=12, fontweight='bold')
     ax.set_ylabel('Latency (ms)', fontsize=12, fontweight='bold')
     ax.set_title(f'{report_name}\nQuery Latency by Load Level', fontsize=14, fontweight='bold', pad=20)
     ax.set_xticks(x)
-    ax.set_xticklabels([f"{row['load_name']}\n({row['mb_per_sec']} MB/s)" for _, row in df.iterrows()])
+    ax.set_xticklabels(xt_labels)
     ax.legend(loc='upper left', framealpha=0.9)
     ax.grid(axis='y', linestyle='--', alpha=0.7)
 
     # Add value labels on bars
-    for bars in [bars1, bars2, bars3]:
-        for bar in bars:
-            height = bar.get_height()
-            if height > 0:
-                ax.annotate(f'{height:.1f}',
-                            xy=(bar.get_x() + bar.get_width() / 2, height),
-                            xytext=(0, 3), textcoords="offset points",
-                            ha='center', va='bottom', fontsize=8, color=COLORS['text'])
-
-    plt.tight_layout()
+    for bars, column in [(bars1, 'p50_ms'), (bars2, 'p90_ms'), (bars3, 'p99_ms')]:
+        ax.bar_label(bars, labels=bar_value_labels(df[column], '.1f'),
+                     padding=3, fontsize=8, color=COLORS['text'])
+
     output_path = output_dir / f'report-{timestamp}-latency_comparison.png'
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"  ✅ Created: {output_path}")
+    save_chart(fig, output_path)
 
 
-def create_resources_chart(df: pd.DataFrame, output_dir: Path, report_name: str, timestamp: str) -> None:
+def create_resources_chart(df: pd.DataFrame, xt_labels: list[str], output_dir: Path, report_name: str, timestamp: str) -> None:
     """Create resource usage dual-axis chart."""
-    fig, ax1 = plt.subplots(figsize=(12, 7))
+    fig = reusable_fig((12, 7))
+    ax1 = fig.subplots()
 
-    x = range(len(df))
+    x = np.arange(len(df))
     width = 0.35
 
     # CPU bars on primary axis (in millicores)
-    bars1 = ax1.bar([i - width/2 for i in x], df['cpu_millicores'], width,
+    bars1 = ax1.bar(x - width/2, df['cpu_millicores'].to_numpy(), width,
                     label='CPU (millicores)', color=COLORS['primary'], edgecolor='white', linewidth=0.5)
     ax1.set_xlabel('Load Configuration', fontsize=12, fontweight='bold')
     ax1.set_ylabel('CPU (millicores)', fontsize=12, fontweight='bold', color=COLORS['primary'])
@@ -311,7 +469,7 @@ def create_resources_chart(df: pd.DataFrame, output_dir: Path, report_name: str,
 
     # Memory bars on secondary axis
     ax2 = ax1.twinx()
-    bars2 = ax2.bar([i + width/2 for i in x], df['memory_gb'], width,
+    bars2 = ax2.bar(x + width/2, df['memory_gb'].to_numpy(), width,
                     label='Memory (GB)', color=COLORS['secondary'], edgecolor='white', linewidth=0.5)
     ax2.set_ylabel('Memory (GB)', fontsize=12, fontweight='bold', color=COLORS['secondary'])
     ax2.tick_params(axis='y', labelcolor=COLORS['secondary'])
@@ -319,7 +477,7 @@ def create_resources_chart(df: pd.DataFrame, output_dir: Path, report_name: str,
     ax1.set_title(f'{report_name}\nResource Usage by Load Level\n(CPU: container_cpu_usage_seconds_total, Memory: container_memory_working_set_bytes)', 
                   fontsize=14, fontweight='bold', pad=20)
     ax1.set_xticks(x)
-    ax1.set_xticklabels([f"{row['load_name']}\n({row['mb_per_sec']} MB/s)" for _, row in df.iterrows()])
+    ax1.set_xticklabels(xt_labels)
 
     # Combined legend
     lines1, labels1 = ax1.get_legend_handles_labels()
@@ -328,21 +486,19 @@ def create_resources_chart(df: pd.DataFrame, output_dir: Path, report_name: str,
 
     ax1.grid(axis='y', linestyle='--', alpha=0.5)
 
-    plt.tight_layout()
     output_path = output_dir / f'report-{timestamp}-resource_usage.png'
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"  ✅ Created: {output_path}")
+    save_chart(fig, output_path)
 
 
-def create_throughput_chart(df: pd.DataFrame, output_dir: Path, report_name: str, timestamp: str) -> None:
+def create_throughput_chart(df: pd.DataFrame, xt_labels: list[str], output_dir: Path, report_name: str, timestamp: str) -> None:
     """Create throughput analysis chart showing spans/sec by load level."""
-    fig, ax = plt.subplots(figsize=(12, 7))
+    fig = reusable_fig((12, 7))
+    ax = fig.subplots()
 
-    x = range(len(df))
+    x = np.arange(len(df))
     width = 0.6
 
-    bars = ax.bar(x, df['spans_per_sec'], width,
+    bars = ax.bar(x, df['spans_per_sec'].to_numpy(), width,
                   label='Actual Spans/sec', color=COLORS['success'],
                   edgecolor='white', linewidth=0.5)
 
@@ -350,36 +506,28 @@ def create_throughput_chart(df: pd.DataFrame, output_dir: Path, report_name: str
     ax.set_ylabel('Spans per Second', fontsize=12, fontweight='bold')
     ax.set_title(f'{report_name}\nThroughput (Spans/sec) by Load Level', fontsize=14, fontweight='bold', pad=20)
     ax.set_xticks(x)
-    ax.set_xticklabels([f"{row['load_name']}\n({row['mb_per_sec']} MB/s)" for _, row in df.iterrows()])
+    ax.set_xticklabels(xt_labels)
     ax.legend(loc='upper left', framealpha=0.9)
     ax.grid(axis='y', linestyle='--', alpha=0.7)
 
     # Add value labels on bars
-    for bar in bars:
-        height = bar.get_height()
-        if height > 0:
-            ax.annotate(f'{height:.0f}',
-                        xy=(bar.get_x() + bar.get_width() / 2, height),
-                        xytext=(0, 5), textcoords="offset points",
-                        ha='center', va='bottom', fontsize=10,
-                        color=COLORS['text'], fontweight='bold')
+    ax.bar_label(bars, labels=bar_value_labels(df['spans_per_sec'], '.0f'),
+                 padding=5, fontsize=10, color=COLORS['text'], fontweight='bold')
 
-    plt.tight_layout()
     output_path = output_dir / f'report-{timestamp}-throughput_analysis.png'
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"  ✅ Created: {output_path}")
+    save_chart(fig, output_path)
 
 
-def create_error_chart(df: pd.DataFrame, output_dir: Path, report_name: str, timestamp: str) -> None:
+def create_error_chart(df: pd.DataFrame, xt_labels: list[str], output_dir: Path, report_name: str, timestamp: str) -> None:
     """Create error rates chart."""
-    fig, ax1 = plt.subplots(figsize=(12, 7))
+    fig = reusable_fig((12, 7))
+    ax1 = fig.subplots()
 
-    x = range(len(df))
+    x = np.arange(len(df))
     width = 0.25
 
     # Error rate bars
-    bars1 = ax1.bar([i - width for i in x], df['error_rate'], width,
+    bars1 = ax1.bar(x - width, df['error_rate'].to_numpy(), width,
                     label='Error Rate (%)', color=COLORS['secondary'],
                     edgecolor='white', linewidth=0.5)
     ax1.set_xlabel('Load Configuration', fontsize=12, fontweight='bold')
@@ -388,10 +536,10 @@ def create_error_chart(df: pd.DataFrame, output_dir: Path, report_name: str, tim
 
     # Dropped and discarded spans on secondary axis
     ax2 = ax1.twinx()
-    bars2 = ax2.bar(x, df['dropped_spans'], width,
+    bars2 = ax2.bar(x, df['dropped_spans'].to_numpy(), width,
                     label='Dropped Spans/sec', color=COLORS['accent'],
                     edgecolor='white', linewidth=0.5)
-    bars3 = ax2.bar([i + width for i in x], df['discarded_spans'], width,
+    bars3 = ax2.bar(x + width, df['discarded_spans'].to_numpy(), width,
                     label='Discarded Spans/sec', color=COLORS['tertiary'],
                     edgecolor='white', linewidth=0.5)
     ax2.set_ylabel('Spans/sec', fontsize=12, fontweight='bold', color=COLORS['accent'])
@@ -399,7 +547,7 @@ def create_error_chart(df: pd.DataFrame, output_dir: Path, report_name: str, tim
 
     ax1.set_title(f'{report_name}\nError Metrics by Load Level', fontsize=14, fontweight='bold', pad=20)
     ax1.set_xticks(x)
-    ax1.set_xticklabels([f"{row['load_name']}\n({row['mb_per_sec']} MB/s)" for _, row in df.iterrows()])
+    ax1.set_xticklabels(xt_labels)
 
     # Combined legend
     lines1, labels1 = ax1.get_legend_handles_labels()
@@ -408,24 +556,22 @@ def create_error_chart(df: pd.DataFrame, output_dir: Path, report_name: str, tim
 
     ax1.grid(axis='y', linestyle='--', alpha=0.5)
 
-    plt.tight_layout()
     output_path = output_dir / f'report-{timestamp}-error_metrics.png'
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"  ✅ Created: {output_path}")
+    save_chart(fig, output_path)
 
 
-def create_bytes_ingested_chart(df: pd.DataFrame, output_dir: Path, report_name: str, timestamp: str) -> None:
+def create_bytes_ingested_chart(df: pd.DataFrame, xt_labels: list[str], output_dir: Path, report_name: str, timestamp: str) -> None:
     """Create bytes ingested comparison bar chart showing target vs actual MB/s."""
-    fig, ax = plt.subplots(figsize=(12, 7))
+    fig = reusable_fig((12, 7))
+    ax = fig.subplots()
 
-    x = range(len(df))
+    x = np.arange(len(df))
     width = 0.35
 
-    bars1 = ax.bar([i - width/2 for i in x], df['mb_per_sec'], width,
+    bars1 = ax.bar(x - width/2, df['mb_per_sec'].to_numpy(), width,
                    label='Target MB/s', color=COLORS['quaternary'],
                    edgecolor='white', linewidth=0.5, alpha=0.7)
-    bars2 = ax.bar([i + width/2 for i in x], df['mb_per_sec_actual'], width,
+    bars2 = ax.bar(x + width/2, df['mb_per_sec_actual'].to_numpy(), width,
                    label='Actual MB/s', color=COLORS['primary'],
                    edgecolor='white', linewidth=0.5)
 
@@ -433,28 +579,19 @@ def create_bytes_ingested_chart(df: pd.DataFrame, output_dir: Path, report_name:
     ax.set_ylabel('Ingestion Rate (MB/s)', fontsize=12, fontweight='bold')
     ax.set_title(f'{report_name}\nBytes Ingested: Target vs Actual', fontsize=14, fontweight='bold', pad=20)
     ax.set_xticks(x)
-    ax.set_xticklabels([f"{row['load_name']}\n({row['mb_per_sec']} MB/s)" for _, row in df.iterrows()])
+    ax.set_xticklabels(xt_labels)
     ax.legend(loc='upper left', framealpha=0.9)
     ax.grid(axis='y', linestyle='--', alpha=0.7)
 
-    # Add efficiency percentage and value labels
-    for i, (_, row) in enumerate(df.iterrows()):
-        # Add value label on target bar
-        ax.annotate(f'{row["mb_per_sec"]:.1f}',
-                    xy=(i - width/2, row['mb_per_sec']),
-                    xytext=(0, 3), textcoords="offset points",
-                    ha='center', va='bottom', fontsize=9, color=COLORS['text'])
-        
-        # Add value label on actual bar
-        ax.annotate(f'{row["mb_per_sec_actual"]:.2f}',
-                    xy=(i + width/2, row['mb_per_sec_actual']),
-                    xytext=(0, 3), textcoords="offset points",
-                    ha='center', va='bottom', fontsize=9, color=COLORS['text'])
-        
-        # Add efficiency percentage above
-        if row['mb_per_sec'] > 0:
-            efficiency = (row['mb_per_sec_actual'] / row['mb_per_sec']) * 100
-            max_val = max(row['mb_per_sec'], row['mb_per_sec_actual'])
+    # Add value labels on target and actual bars
+    ax.bar_label(bars1, fmt='%.1f', padding=3, fontsize=9, color=COLORS['text'])
+    ax.bar_label(bars2, fmt='%.2f', padding=3, fontsize=9, color=COLORS['text'])
+
+    # Add efficiency percentage above
+    for i, (target, actual) in enumerate(zip(df['mb_per_sec'], df['mb_per_sec_actual'])):
+        if target > 0:
+            efficiency = (actual / target) * 100
+            max_val = max(target, actual)
             ax.annotate(f'{efficiency:.0f}%',
                         xy=(i, max_val),
                         xytext=(0, 15), textcoords="offset points",
@@ -462,21 +599,19 @@ def create_bytes_ingested_chart(df: pd.DataFrame, output_dir: Path, report_name:
                         color=COLORS['success'] if efficiency >= 90 else COLORS['warning'],
                         fontweight='bold')
 
-    plt.tight_layout()
     output_path = output_dir / f'report-{timestamp}-bytes_ingested.png'
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"  ✅ Created: {output_path}")
+    save_chart(fig, output_path)
 
 
-def create_spans_returned_chart(df: pd.DataFrame, output_dir: Path, report_name: str, timestamp: str) -> None:
+def create_spans_returned_chart(df: pd.DataFrame, xt_labels: list[str], output_dir: Path, report_name: str, timestamp: str) -> None:
     """Create average spans returned per query bar chart."""
-    fig, ax = plt.subplots(figsize=(12, 7))
+    fig = reusable_fig((12, 7))
+    ax = fig.subplots()
 
-    x = range(len(df))
+    x = np.arange(len(df))
     width = 0.6
 
-    bars = ax.bar(x, df['avg_spans_returned'], width,
+    bars = ax.bar(x, df['avg_spans_returned'].to_numpy(), width,
                   label='Avg Spans Returned', color=COLORS['accent'],
                   edgecolor='white', linewidth=0.5)
 
@@ -484,43 +619,35 @@ def create_spans_returned_chart(df: pd.DataFrame, output_dir: Path, report_name:
     ax.set_ylabel('Average Spans Returned', fontsize=12, fontweight='bold')
     ax.set_title(f'{report_name}\nAverage Spans Returned per Query', fontsize=14, fontweight='bold', pad=20)
     ax.set_xticks(x)
-    ax.set_xticklabels([f"{row['load_name']}\n({row['mb_per_sec']} MB/s)" for _, row in df.iterrows()])
+    ax.set_xticklabels(xt_labels)
     ax.legend(loc='upper left', framealpha=0.9)
     ax.grid(axis='y', linestyle='--', alpha=0.7)
 
     # Add value labels on bars
-    for bar in bars:
-        height = bar.get_height()
-        if height > 0:
-            ax.annotate(f'{height:.1f}',
-                        xy=(bar.get_x() + bar.get_width() / 2, height),
-                        xytext=(0, 5), textcoords="offset points",
-                        ha='center', va='bottom', fontsize=10,
-                        color=COLORS['text'], fontweight='bold')
+    ax.bar_label(bars, labels=bar_value_labels(df['avg_spans_returned'], '.1f'),
+                 padding=5, fontsize=10, color=COLORS['text'], fontweight='bold')
 
-    plt.tight_layout()
     output_path = output_dir / f'report-{timestamp}-spans_returned.png'
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"  ✅ Created: {output_path}")
+    save_chart(fig, output_path)
 
 
-def create_qps_comparison_chart(df: pd.DataFrame, output_dir: Path, report_name: str, timestamp: str) -> None:
+def create_qps_comparison_chart(df: pd.DataFrame, xt_labels: list[str], output_dir: Path, report_name: str, timestamp: str) -> None:
     """Create QPS (queries per second) comparison bar chart showing target vs actual."""
     # Check if we have QPS data
     if df['actual_qps'].sum() == 0 and df['target_qps'].sum() == 0:
         print(f"  ⚠️  No QPS data available, skipping QPS comparison chart")
         return
     
-    fig, ax = plt.subplots(figsize=(12, 7))
+    fig = reusable_fig((12, 7))
+    ax = fig.subplots()
 
-    x = range(len(df))
+    x = np.arange(len(df))
     width = 0.35
 
-    bars1 = ax.bar([i - width/2 for i in x], df['target_qps'], width,
+    bars1 = ax.bar(x - width/2, df['target_qps'].to_numpy(), width,
                    label='Target QPS', color=COLORS['quaternary'],
                    edgecolor='white', linewidth=0.5, alpha=0.7)
-    bars2 = ax.bar([i + width/2 for i in x], df['actual_qps'], width,
+    bars2 = ax.bar(x + width/2, df['actual_qps'].to_numpy(), width,
                    label='Actual QPS', color=COLORS['primary'],
                    edgecolor='white', linewidth=0.5)
 
@@ -528,30 +655,21 @@ def create_qps_comparison_chart(df: pd.DataFrame, output_dir: Path, report_name:
     ax.set_ylabel('Queries per Second (QPS)', fontsize=12, fontweight='bold')
     ax.set_title(f'{report_name}\nQPS: Target vs Actual', fontsize=14, fontweight='bold', pad=20)
     ax.set_xticks(x)
-    ax.set_xticklabels([f"{row['load_name']}\n({row['mb_per_sec']} MB/s)" for _, row in df.iterrows()])
+    ax.set_xticklabels(xt_labels)
     ax.legend(loc='upper left', framealpha=0.9)
     ax.grid(axis='y', linestyle='--', alpha=0.7)
 
-    # Add efficiency percentage and value labels
-    for i, (_, row) in enumerate(df.iterrows()):
-        # Add value label on target bar
-        if row['target_qps'] > 0:
-            ax.annotate(f'{row["target_qps"]:.1f}',
-                        xy=(i - width/2, row['target_qps']),
-                        xytext=(0, 3), textcoords="offset points",
-                        ha='center', va='bottom', fontsize=9, color=COLORS['text'])
-        
-        # Add value label on actual bar
-        if row['actual_qps'] > 0:
-            ax.annotate(f'{row["actual_qps"]:.2f}',
-                        xy=(i + width/2, row['actual_qps']),
-                        xytext=(0, 3), textcoords="offset points",
-                        ha='center', va='bottom', fontsize=9, color=COLORS['text'])
-        
-        # Add efficiency percentage above
-        if row['target_qps'] > 0:
-            efficiency = (row['actual_qps'] / row['target_qps']) * 100
-            max_val = max(row['target_qps'], row['actual_qps'])
+    # Add value labels on target and actual bars
+    ax.bar_label(bars1, labels=bar_value_labels(df['target_qps'], '.1f'),
+                 padding=3, fontsize=9, color=COLORS['text'])
+    ax.bar_label(bars2, labels=bar_value_labels(df['actual_qps'], '.2f'),
+                 padding=3, fontsize=9, color=COLORS['text'])
+
+    # Add efficiency percentage above
+    for i, (target, actual) in enumerate(zip(df['target_qps'], df['actual_qps'])):
+        if target > 0:
+            efficiency = (actual / target) * 100
+            max_val = max(target, actual)
             ax.annotate(f'{efficiency:.0f}%',
                         xy=(i, max_val),
                         xytext=(0, 15), textcoords="offset points",
@@ -559,11 +677,8 @@ def create_qps_comparison_chart(df: pd.DataFrame, output_dir: Path, report_name:
                         color=COLORS['success'] if efficiency >= 90 else COLORS['warning'],
                         fontweight='bold')
 
-    plt.tight_layout()
     output_path = output_dir / f'report-{timestamp}-qps_comparison.png'
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"  ✅ Created: {output_path}")
+    save_chart(fig, output_path)
 
 
 def create_resources_vs_ingestion_chart(df: pd.DataFrame, output_dir: Path, report_name: str, timestamp: str) -> None:
@@ -572,7 +687,8 @@ def create_resources_vs_ingestion_chart(df: pd.DataFrame, output_dir: Path, repo
         print(f"  ⚠️  Not enough data points for resources vs ingestion chart")
         return
     
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+    fig = reusable_fig((14, 6))
+    ax1, ax2 = fig.subplots(1, 2)
     
     # Sort by actual MB/s for proper line plot
     df_sorted = df.sort_values('mb_per_sec_actual').reset_index(drop=True)
@@ -633,13 +749,10 @@ def create_resources_vs_ingestion_chart(df: pd.DataFrame, output_dir: Path, repo
     ax2.set_xlim(left=0)
     ax2.set_ylim(bottom=0)
     
-    plt.suptitle(f'{report_name}\nResource Scaling vs Ingestion Rate', 
-                 fontsize=14, fontweight='bold', y=1.02)
-    plt.tight_layout()
+    fig.suptitle(f'{report_name}\nResource Scaling vs Ingestion Rate', 
+                 fontsize=14, fontweight='bold')
     output_path = output_dir / f'report-{timestamp}-resources_vs_ingestion.png'
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"  ✅ Created: {output_path}")
+    save_chart(fig, output_path)
 
 
 def create_resources_vs_qps_chart(df: pd.DataFrame, output_dir: Path, report_name: str, timestamp: str) -> None:
@@ -653,7 +766,8 @@ def create_resources_vs_qps_chart(df: pd.DataFrame, output_dir: Path, report_nam
         print(f"  ⚠️  Not enough data points for resources vs QPS chart")
         return
     
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+    fig = reusable_fig((14, 6))
+    ax1, ax2 = fig.subplots(1, 2)
     
     # Sort by actual QPS for proper line plot
     df_sorted = df.sort_values('actual_qps').reset_index(drop=True)
@@ -714,13 +828,10 @@ def create_resources_vs_qps_chart(df: pd.DataFrame, output_dir: Path, report_nam
     ax2.set_xlim(left=0)
     ax2.set_ylim(bottom=0)
     
-    plt.suptitle(f'{report_name}\nResource Scaling vs Query Load (QPS)', 
-                 fontsize=14, fontweight='bold', y=1.02)
-    plt.tight_layout()
+    fig.suptitle(f'{report_name}\nResource Scaling vs Query Load (QPS)', 
+                 fontsize=14, fontweight='bold')
     output_path = output_dir / f'report-{timestamp}-resources_vs_qps.png'
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"  ✅ Created: {output_path}")
+    save_chart(fig, output_path)
 
 
 def create_combined_scaling_chart(df: pd.DataFrame, output_dir: Path, report_name: str, timestamp: str) -> None:
@@ -731,7 +842,8 @@ def create_combined_scaling_chart(df: pd.DataFrame, output_dir: Path, report_nam
     
     has_qps = df['actual_qps'].sum() > 0
     
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    fig = reusable_fig((14, 10))
+    axes = fig.subplots(2, 2)
     
     # Sort by actual MB/s for ingestion charts
     df_by_ingestion = df.sort_values('mb_per_sec_actual').reset_index(drop=True)
@@ -816,33 +928,37 @@ def create_combined_scaling_chart(df: pd.DataFrame, output_dir: Path, report_nam
         axes[1, 1].text(0.5, 0.5, 'No QPS data available', 
                         ha='center', va='center', fontsize=12, color=COLORS['text'])
     
-    plt.suptitle(f'{report_name}\nResource Scaling Analysis', 
-                 fontsize=14, fontweight='bold', y=1.02)
-    plt.tight_layout()
+    fig.suptitle(f'{report_name}\nResource Scaling Analysis', 
+                 fontsize=14, fontweight='bold')
     output_path = output_dir / f'report-{timestamp}-resource_scaling.png'
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"  ✅ Created: {output_path}")
+    save_chart(fig, output_path)
 
 
-def generate_static_charts(df: pd.DataFrame, output_dir: Path, report_name: str, timestamp: str) -> None:
-    """Generate all static PNG charts."""
+def generate_static_charts(df: pd.DataFrame, output_dir: Path, report_name: str, timestamp: str,
+                           pool: Executor) -> list[Future]:
+    """Queue all static PNG charts on the worker pool."""
     print("\n📊 Generating static charts (PNG)...")
     charts_dir = output_dir / 'charts'
     charts_dir.mkdir(parents=True, exist_ok=True)
 
-    create_latency_chart(df, charts_dir, report_name, timestamp)
-    create_resources_chart(df, charts_dir, report_name, timestamp)
-    create_throughput_chart(df, charts_dir, report_name, timestamp)
-    create_error_chart(df, charts_dir, report_name, timestamp)
-    create_bytes_ingested_chart(df, charts_dir, report_name, timestamp)
-    create_spans_returned_chart(df, charts_dir, report_name, timestamp)
-    create_qps_comparison_chart(df, charts_dir, report_name, timestamp)
-    
-    # Resource scaling charts (line plots showing resource vs load correlation)
-    create_resources_vs_ingestion_chart(df, charts_dir, report_name, timestamp)
-    create_resources_vs_qps_chart(df, charts_dir, report_name, timestamp)
-    create_combined_scaling_chart(df, charts_dir, report_name, timestamp)
+    # X tick labels shared by all bar charts
+    xt_labels = (df['load_name'] + '\n(' + df['mb_per_sec'].astype(str) + ' MB/s)').tolist()
+    bar_args = (df, xt_labels, charts_dir, report_name, timestamp)
+    line_args = (df, charts_dir, report_name, timestamp)
+
+    return render_charts(pool, [
+        (create_latency_chart, bar_args),
+        (create_resources_chart, bar_args),
+        (create_throughput_chart, bar_args),
+        (create_error_chart, bar_args),
+        (create_bytes_ingested_chart, bar_args),
+        (create_spans_returned_chart, bar_args),
+        (create_qps_comparison_chart, bar_args),
+        # Resource scaling charts (line plots showing resource vs load correlation)
+        (create_resources_vs_ingestion_chart, line_args),
+        (create_resources_vs_qps_chart, line_args),
+        (create_combined_scaling_chart, line_args),
+    ])
 
 
 # =============================================================================
@@ -851,24 +967,24 @@ def generate_static_charts(df: pd.DataFrame, output_dir: Path, report_name: str,
 
 LOAD_COLORS = [COLORS['primary'], COLORS['secondary'], COLORS['tertiary'], 
                COLORS['quaternary'], COLORS['accent'], COLORS['success']]
+# Translucent variants of LOAD_COLORS for area fills, e.g. 'rgba(0, 217, 255, 0.1)'
+LOAD_FILL_COLORS = [f'rgba{tuple(bytes.fromhex(c[1:])) + (0.1,)}' for c in LOAD_COLORS]
 
 
-def create_timeseries_latency_chart(ts_df: pd.DataFrame, output_dir: Path, report_name: str, timestamp: str) -> None:
+def create_timeseries_latency_chart(groups: dict[str, pd.DataFrame], output_dir: Path, report_name: str, timestamp: str) -> None:
     """Create time-series latency chart showing P50/P90/P99 over time."""
-    if ts_df.empty:
+    if not groups:
         return
     
-    fig, axes = plt.subplots(3, 1, figsize=(14, 10), sharex=True)
-    
-    loads = ts_df['load_name'].unique()
+    fig = reusable_fig((14, 10))
+    axes = fig.subplots(3, 1, sharex=True)
     
     for idx, (ax, metric, title) in enumerate(zip(
         axes, 
         ['p50_ms', 'p90_ms', 'p99_ms'],
         ['P50 Latency', 'P90 Latency', 'P99 Latency']
     )):
-        for i, load in enumerate(loads):
-            load_data = ts_df[ts_df['load_name'] == load]
+        for i, (load, load_data) in enumerate(groups.items()):
             ax.plot(load_data['minute'], load_data[metric], 
                    label=load, color=LOAD_COLORS[i % len(LOAD_COLORS)],
                    linewidth=2, marker='o', markersize=3)
@@ -881,25 +997,20 @@ def create_timeseries_latency_chart(ts_df: pd.DataFrame, output_dir: Path, repor
     axes[0].set_title(f'{report_name}\nP50 Latency Over Time', fontsize=12, fontweight='bold')
     axes[-1].set_xlabel('Time (minutes)', fontsize=11, fontweight='bold')
     
-    plt.tight_layout()
     output_path = output_dir / f'report-{timestamp}-timeseries_latency.png'
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"  ✅ Created: {output_path}")
+    save_chart(fig, output_path)
 
 
-def create_timeseries_resources_chart(ts_df: pd.DataFrame, output_dir: Path, report_name: str, timestamp: str) -> None:
+def create_timeseries_resources_chart(groups: dict[str, pd.DataFrame], output_dir: Path, report_name: str, timestamp: str) -> None:
     """Create time-series resource usage chart showing CPU and memory over time."""
-    if ts_df.empty:
+    if not groups:
         return
     
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 8), sharex=True)
-    
-    loads = ts_df['load_name'].unique()
+    fig = reusable_fig((14, 8))
+    ax1, ax2 = fig.subplots(2, 1, sharex=True)
     
     # CPU chart (in millicores)
-    for i, load in enumerate(loads):
-        load_data = ts_df[ts_df['load_name'] == load]
+    for i, (load, load_data) in enumerate(groups.items()):
         ax1.plot(load_data['minute'], load_data['cpu_millicores'], 
                 label=load, color=LOAD_COLORS[i % len(LOAD_COLORS)],
                 linewidth=2, marker='o', markersize=3)
@@ -910,8 +1021,7 @@ def create_timeseries_resources_chart(ts_df: pd.DataFrame, output_dir: Path, rep
     ax1.grid(True, linestyle='--', alpha=0.7)
     
     # Memory chart
-    for i, load in enumerate(loads):
-        load_data = ts_df[ts_df['load_name'] == load]
+    for i, (load, load_data) in enumerate(groups.items()):
         ax2.plot(load_data['minute'], load_data['memory_gb'], 
                 label=load, color=LOAD_COLORS[i % len(LOAD_COLORS)],
                 linewidth=2, marker='o', markersize=3)
@@ -922,27 +1032,21 @@ def create_timeseries_resources_chart(ts_df: pd.DataFrame, output_dir: Path, rep
     ax2.legend(loc='upper right', framealpha=0.9)
     ax2.grid(True, linestyle='--', alpha=0.7)
     
-    plt.tight_layout()
     output_path = output_dir / f'report-{timestamp}-timeseries_resources.png'
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"  ✅ Created: {output_path}")
+    save_chart(fig, output_path)
 
 
-def create_timeseries_throughput_chart(ts_df: pd.DataFrame, output_dir: Path, report_name: str, timestamp: str) -> None:
+def create_timeseries_throughput_chart(groups: dict[str, pd.DataFrame], output_dir: Path, report_name: str, timestamp: str) -> None:
     """Create time-series throughput chart showing spans/sec and MB/s over time."""
-    if ts_df.empty:
+    if not groups:
         return
     
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 8), sharex=True)
-    
-    loads = ts_df['load_name'].unique()
+    fig = reusable_fig((14, 8))
+    ax1, ax2 = fig.subplots(2, 1, sharex=True)
     
     # MB/sec chart (primary - bytes ingested is now the main metric)
-    for i, load in enumerate(loads):
-        load_data = ts_df[ts_df['load_name'] == load]
-        # Convert to MB/sec for readability
-        ax1.plot(load_data['minute'], load_data['bytes_per_sec'] / (1024 * 1024), 
+    for i, (load, load_data) in enumerate(groups.items()):
+        ax1.plot(load_data['minute'], load_data['mb_per_sec_ts'], 
                 label=load, color=LOAD_COLORS[i % len(LOAD_COLORS)],
                 linewidth=2, marker='o', markersize=3)
     
@@ -952,8 +1056,7 @@ def create_timeseries_throughput_chart(ts_df: pd.DataFrame, output_dir: Path, re
     ax1.grid(True, linestyle='--', alpha=0.7)
     
     # Spans/sec chart
-    for i, load in enumerate(loads):
-        load_data = ts_df[ts_df['load_name'] == load]
+    for i, (load, load_data) in enumerate(groups.items()):
         ax2.plot(load_data['minute'], load_data['spans_per_sec'], 
                 label=load, color=LOAD_COLORS[i % len(LOAD_COLORS)],
                 linewidth=2, marker='o', markersize=3)
@@ -964,25 +1067,20 @@ def create_timeseries_throughput_chart(ts_df: pd.DataFrame, output_dir: Path, re
     ax2.legend(loc='upper right', framealpha=0.9)
     ax2.grid(True, linestyle='--', alpha=0.7)
     
-    plt.tight_layout()
     output_path = output_dir / f'report-{timestamp}-timeseries_throughput.png'
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"  ✅ Created: {output_path}")
+    save_chart(fig, output_path)
 
 
-def create_timeseries_errors_chart(ts_df: pd.DataFrame, output_dir: Path, report_name: str, timestamp: str) -> None:
+def create_timeseries_errors_chart(groups: dict[str, pd.DataFrame], output_dir: Path, report_name: str, timestamp: str) -> None:
     """Create time-series error metrics chart."""
-    if ts_df.empty:
+    if not groups:
         return
     
-    fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(14, 10), sharex=True)
-    
-    loads = ts_df['load_name'].unique()
+    fig = reusable_fig((14, 10))
+    ax1, ax2, ax3 = fig.subplots(3, 1, sharex=True)
     
     # Query failures chart
-    for i, load in enumerate(loads):
-        load_data = ts_df[ts_df['load_name'] == load]
+    for i, (load, load_data) in enumerate(groups.items()):
         ax1.plot(load_data['minute'], load_data['query_failures'], 
                 label=load, color=LOAD_COLORS[i % len(LOAD_COLORS)],
                 linewidth=2, marker='o', markersize=3)
@@ -993,8 +1091,7 @@ def create_timeseries_errors_chart(ts_df: pd.DataFrame, output_dir: Path, report
     ax1.grid(True, linestyle='--', alpha=0.7)
     
     # Dropped spans chart
-    for i, load in enumerate(loads):
-        load_data = ts_df[ts_df['load_name'] == load]
+    for i, (load, load_data) in enumerate(groups.items()):
         ax2.plot(load_data['minute'], load_data['dropped_spans'], 
                 label=load, color=LOAD_COLORS[i % len(LOAD_COLORS)],
                 linewidth=2, marker='o', markersize=3)
@@ -1005,8 +1102,7 @@ def create_timeseries_errors_chart(ts_df: pd.DataFrame, output_dir: Path, report
     ax2.grid(True, linestyle='--', alpha=0.7)
     
     # Discarded spans chart
-    for i, load in enumerate(loads):
-        load_data = ts_df[ts_df['load_name'] == load]
+    for i, (load, load_data) in enumerate(groups.items()):
         ax3.plot(load_data['minute'], load_data['discarded_spans'], 
                 label=load, color=LOAD_COLORS[i % len(LOAD_COLORS)],
                 linewidth=2, marker='o', markersize=3)
@@ -1017,24 +1113,19 @@ def create_timeseries_errors_chart(ts_df: pd.DataFrame, output_dir: Path, report
     ax3.legend(loc='upper right', framealpha=0.9)
     ax3.grid(True, linestyle='--', alpha=0.7)
     
-    plt.tight_layout()
     output_path = output_dir / f'report-{timestamp}-timeseries_errors.png'
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"  ✅ Created: {output_path}")
+    save_chart(fig, output_path)
 
 
-def create_timeseries_spans_returned_chart(ts_df: pd.DataFrame, output_dir: Path, report_name: str, timestamp: str) -> None:
+def create_timeseries_spans_returned_chart(groups: dict[str, pd.DataFrame], output_dir: Path, report_name: str, timestamp: str) -> None:
     """Create time-series chart showing average spans returned per query over time."""
-    if ts_df.empty:
+    if not groups:
         return
     
-    fig, ax = plt.subplots(figsize=(14, 6))
-    
-    loads = ts_df['load_name'].unique()
+    fig = reusable_fig((14, 6))
+    ax = fig.subplots()
     
-    for i, load in enumerate(loads):
-        load_data = ts_df[ts_df['load_name'] == load]
+    for i, (load, load_data) in enumerate(groups.items()):
         ax.plot(load_data['minute'], load_data['avg_spans_returned'], 
                label=load, color=LOAD_COLORS[i % len(LOAD_COLORS)],
                linewidth=2, marker='o', markersize=3)
@@ -1045,29 +1136,24 @@ def create_timeseries_spans_returned_chart(ts_df: pd.DataFrame, output_dir: Path
     ax.legend(loc='upper right', framealpha=0.9)
     ax.grid(True, linestyle='--', alpha=0.7)
     
-    plt.tight_layout()
     output_path = output_dir / f'report-{timestamp}-timeseries_spans_returned.png'
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"  ✅ Created: {output_path}")
+    save_chart(fig, output_path)
 
 
-def create_timeseries_qps_chart(ts_df: pd.DataFrame, output_dir: Path, report_name: str, timestamp: str) -> None:
+def create_timeseries_qps_chart(groups: dict[str, pd.DataFrame], output_dir: Path, report_name: str, timestamp: str) -> None:
     """Create time-series chart showing QPS (actual vs target) over time."""
-    if ts_df.empty:
+    if not groups:
         return
     
     # Check if we have QPS data
-    if 'qps' not in ts_df.columns or ts_df['qps'].sum() == 0:
+    if sum(load_data['qps'].sum() for load_data in groups.values()) == 0:
         print(f"  ⚠️  No QPS time-series data available, skipping QPS time-series chart")
         return
     
-    fig, ax = plt.subplots(figsize=(14, 6))
-    
-    loads = ts_df['load_name'].unique()
+    fig = reusable_fig((14, 6))
+    ax = fig.subplots()
     
-    for i, load in enumerate(loads):
-        load_data = ts_df[ts_df['load_name'] == load]
+    for i, (load, load_data) in enumerate(groups.items()):
         color = LOAD_COLORS[i % len(LOAD_COLORS)]
         
         # Plot actual QPS as a solid line
@@ -1087,11 +1173,8 @@ def create_timeseries_qps_chart(ts_df: pd.DataFrame, output_dir: Path, report_na
     ax.legend(loc='upper right', framealpha=0.9, fontsize=9)
     ax.grid(True, linestyle='--', alpha=0.7)
     
-    plt.tight_layout()
     output_path = output_dir / f'report-{timestamp}-timeseries_qps.png'
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"  ✅ Created: {output_path}")
+    save_chart(fig, output_path)
 
 
 def extract_per_container_data(results: list[dict[str, Any]]) -> pd.DataFrame:
@@ -1128,7 +1211,6 @@ def extract_per_container_data(results: list[dict[str, Any]]) -> pd.DataFrame:
                         'container': container_name,
                         'pod': pod_name,
                         'timestamp': ts,
-                        'datetime': datetime.fromtimestamp(ts),
                         'cpu_cores': 0,
                         'cpu_millicores': 0,
                         'memory_gb': 0,
@@ -1152,7 +1234,6 @@ def extract_per_container_data(results: list[dict[str, Any]]) -> pd.DataFrame:
                         'container': container_name,
                         'pod': pod_name,
                         'timestamp': ts,
-                        'datetime': datetime.fromtimestamp(ts),
                         'cpu_cores': 0,
                         'cpu_millicores': 0,
                         'memory_gb': 0,
@@ -1166,15 +1247,12 @@ def extract_per_container_data(results: list[dict[str, Any]]) -> pd.DataFrame:
         return pd.DataFrame()
     
     df = pd.DataFrame(rows)
+    df.insert(4, 'datetime', pd.to_datetime(df['timestamp'], unit='s', cache=True))
     df = df.sort_values(['load_name', 'container', 'timestamp']).reset_index(drop=True)
     
     # Add relative minute column per load and container
-    for load in df['load_name'].unique():
-        for container in df[df['load_name'] == load]['container'].unique():
-            mask = (df['load_name'] == load) & (df['container'] == container)
-            if mask.any():
-                min_ts = df.loc[mask, 'timestamp'].min()
-                df.loc[mask, 'minute'] = ((df.loc[mask, 'timestamp'] - min_ts) / 60).astype(int) + 1
+    start_ts = df.groupby(['load_name', 'container'])['timestamp'].transform('min')
+    df['minute'] = ((df['timestamp'] - start_ts) // 60 + 1).astype('int64')
     
     return df
 
@@ -1184,7 +1262,8 @@ def create_per_container_cpu_chart(container_df: pd.DataFrame, output_dir: Path,
     if container_df.empty:
         return
     
-    fig, ax = plt.subplots(figsize=(14, 8))
+    fig = reusable_fig((14, 8))
+    ax = fig.subplots()
     
     # Get unique combinations of load and container
     loads = container_df['load_name'].unique()
@@ -1212,11 +1291,8 @@ def create_per_container_cpu_chart(container_df: pd.DataFrame, output_dir: Path,
     ax.legend(loc='upper right', framealpha=0.9, fontsize=9)
     ax.grid(True, linestyle='--', alpha=0.7)
     
-    plt.tight_layout()
     output_path = output_dir / f'report-{timestamp}-per_container_cpu.png'
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"  ✅ Created: {output_path}")
+    save_chart(fig, output_path)
 
 
 def create_per_container_memory_chart(container_df: pd.DataFrame, output_dir: Path, report_name: str, timestamp: str) -> None:
@@ -1224,7 +1300,8 @@ def create_per_container_memory_chart(container_df: pd.DataFrame, output_dir: Pa
     if container_df.empty:
         return
     
-    fig, ax = plt.subplots(figsize=(14, 8))
+    fig = reusable_fig((14, 8))
+    ax = fig.subplots()
     
     # Get unique combinations of load and container
     loads = container_df['load_name'].unique()
@@ -1255,15 +1332,14 @@ def create_per_container_memory_chart(container_df: pd.DataFrame, output_dir: Pa
     ax.legend(loc='upper right', framealpha=0.9, fontsize=9)
     ax.grid(True, linestyle='--', alpha=0.7)
     
-    plt.tight_layout()
     output_path = output_dir / f'report-{timestamp}-per_container_memory.png'
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"  ✅ Created: {output_path}")
+    save_chart(fig, output_path)
 
 
-def generate_timeseries_charts(ts_df: pd.DataFrame, output_dir: Path, report_name: str, timestamp: str, results: list[dict[str, Any]] = None) -> None:
-    """Generate all time-series PNG charts."""
+def generate_timeseries_charts(ts_df: pd.DataFrame, output_dir: Path, report_name: str, timestamp: str,
+                               pool: Executor, results: list[dict[str, Any]] = None) -> list[Future]:
+    """Queue all time-series and per-container PNG charts on the worker pool."""
+    pending = []
     if ts_df.empty:
         print("\n⚠️  No time-series data found, skipping time-series charts")
     else:
@@ -1271,12 +1347,17 @@ def generate_timeseries_charts(ts_df: pd.DataFrame, output_dir: Path, report_nam
         charts_dir = output_dir / 'charts'
         charts_dir.mkdir(parents=True, exist_ok=True)
         
-        create_timeseries_latency_chart(ts_df, charts_dir, report_name, timestamp)
-        create_timeseries_resources_chart(ts_df, charts_dir, report_name, timestamp)
-        create_timeseries_throughput_chart(ts_df, charts_dir, report_name, timestamp)
-        create_timeseries_errors_chart(ts_df, charts_dir, report_name, timestamp)
-        create_timeseries_spans_returned_chart(ts_df, charts_dir, report_name, timestamp)
-        create_timeseries_qps_chart(ts_df, charts_dir, report_name, timestamp)
+        # Split by load once instead of filtering ts_df per load in every chart
+        groups = {load: load_data for load, load_data in ts_df.groupby('load_name', sort=False)}
+        ts_args = (groups, charts_dir, report_name, timestamp)
+        pending += render_charts(pool, [
+            (create_timeseries_latency_chart, ts_args),
+            (create_timeseries_resources_chart, ts_args),
+            (create_timeseries_throughput_chart, ts_args),
+            (create_timeseries_errors_chart, ts_args),
+            (create_timeseries_spans_returned_chart, ts_args),
+            (create_timeseries_qps_chart, ts_args),
+        ])
     
     # Generate per-container charts if data is available
     if results:
@@ -1286,16 +1367,82 @@ def generate_timeseries_charts(ts_df: pd.DataFrame, output_dir: Path, report_nam
         
         container_df = extract_per_container_data(results)
         if not container_df.empty:
-            create_per_container_cpu_chart(container_df, charts_dir, report_name, timestamp)
-            create_per_container_memory_chart(container_df, charts_dir, report_name, timestamp)
+            container_args = (container_df, charts_dir, report_name, timestamp)
+            pending += render_charts(pool, [
+                (create_per_container_cpu_chart, container_args),
+                (create_per_container_memory_chart, container_args),
+            ])
         else:
             print("  ⚠️  No per-container data found, skipping per-container charts")
+    return pending
 
 
 # =============================================================================
 # Interactive Dashboard Generation (plotly)
 # =============================================================================
 
+# Trace inputs come straight from our own DataFrames, so skip per-property validation
+UNVALIDATED = {'_validate': False}
+
+DASHBOARD_CONFIG = {
+    'displayModeBar': True,
+    'displaylogo': False,
+    'modeBarButtonsToRemove': ['lasso2d', 'select2d'],
+    'responsive': True,
+}
+
+AXIS_STYLE = dict(showgrid=True, gridwidth=1, gridcolor='#333355', tickfont=dict(color=COLORS['text']))
+
+
+def yaxes_patch(titles: list[str]) -> dict[str, dict]:
+    """Build one layout update that styles and titles yaxis, yaxis2, ... in order."""
+    return {
+        f"yaxis{i if i > 1 else ''}": dict(AXIS_STYLE, title=dict(text=title))
+        for i, title in enumerate(titles, start=1)
+    }
+
+
+DASHBOARD_TEMPLATE = """<html>
+<head><meta charset="utf-8" /></head>
+<body>
+    {plotlyjs}
+    <div id="dashboard" style="width:100%;"></div>
+    <script type="text/javascript">
+        var fig = {fig_json};
+        Plotly.newPlot('dashboard', fig.data, fig.layout, {config_json});
+    </script>
+</body>
+</html>
+"""
+
+
+def plotlyjs_tag(output_dir: Path) -> str:
+    """Return the <script> tag that loads plotly.js according to CHART_PLOTLYJS."""
+    if PLOTLYJS == 'directory':
+        # Versioned so a bundle left by an older plotly is never paired with newer figure JSON
+        bundle = f'plotly-{get_plotlyjs_version()}.min.js'
+        if not (output_dir / bundle).exists():
+            (output_dir / bundle).write_text(get_plotlyjs(), encoding='utf-8')
+        return f'<script src="{bundle}" charset="utf-8"></script>'
+    if PLOTLYJS == 'inline':
+        return f'<script type="text/javascript">{get_plotlyjs()}</script>'
+    return f'<script src="https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js" charset="utf-8"></script>'
+
+
+def write_dashboard(fig: go.Figure, output_path: Path) -> None:
+    """Serialize a dashboard figure once and write it into a minimal HTML page."""
+    html = DASHBOARD_TEMPLATE.format(
+        plotlyjs=plotlyjs_tag(output_path.parent),
+        fig_json=pio.to_json(fig, validate=False),
+        config_json=orjson.dumps(DASHBOARD_CONFIG).decode(),
+    )
+    output_path.write_bytes(html.encode('utf-8'))
+
+
+# With more loads than this, bar value labels are left to hover; each one is an SVG text node
+MAX_BAR_TEXT_LOADS = 12
+
+
 def generate_interactive_dashboard(df: pd.DataFrame, output_dir: Path, report_name: str) -> None:
     """Generate interactive HTML dashboard with plotly."""
     print("\n🌐 Generating interactive dashboard (HTML)...")
@@ -1313,71 +1460,87 @@ def generate_interactive_dashboard(df: pd.DataFrame, output_dir: Path, report_na
         horizontal_spacing=0.1
     )
 
-    load_labels = [f"{row['load_name']}<br>({row['mb_per_sec']} MB/s)" for _, row in df.iterrows()]
+    # (trace, row, col) tuples, added to the figure in one call below
+    traces: list[tuple[go.Bar, int, int]] = []
+
+    load_labels = (df['load_name'] + '<br>(' + df['mb_per_sec'].astype(str) + ' MB/s)').tolist()
+    # One float64 array per metric, used for y and formatted into the bar text
+    values = {c: df[c].to_numpy(dtype=np.float64) for c in (
+        'p50_ms', 'p90_ms', 'p99_ms', 'cpu_millicores', 'memory_gb', 'mb_per_sec',
+        'mb_per_sec_actual', 'error_rate', 'dropped_spans', 'discarded_spans')}
 
     # 1. Latency Chart (top-left)
-    fig.add_trace(go.Bar(
-        name='P50', x=load_labels, y=df['p50_ms'],
-        marker_color=COLORS['primary'], text=df['p50_ms'].round(1),
+    traces.append((go.Bar(**UNVALIDATED,
+        name='P50', x=load_labels, y=values['p50_ms'],
+        marker_color=COLORS['primary'], text=text_labels(values['p50_ms'], 1),
         textposition='outside', textfont=dict(size=10)
-    ), row=1, col=1)
-    fig.add_trace(go.Bar(
-        name='P90', x=load_labels, y=df['p90_ms'],
-        marker_color=COLORS['secondary'], text=df['p90_ms'].round(1),
+    ), 1, 1))
+    traces.append((go.Bar(**UNVALIDATED,
+        name='P90', x=load_labels, y=values['p90_ms'],
+        marker_color=COLORS['secondary'], text=text_labels(values['p90_ms'], 1),
         textposition='outside', textfont=dict(size=10)
-    ), row=1, col=1)
-    fig.add_trace(go.Bar(
-        name='P99', x=load_labels, y=df['p99_ms'],
-        marker_color=COLORS['tertiary'], text=df['p99_ms'].round(1),
+    ), 1, 1))
+    traces.append((go.Bar(**UNVALIDATED,
+        name='P99', x=load_labels, y=values['p99_ms'],
+        marker_color=COLORS['tertiary'], text=text_labels(values['p99_ms'], 1),
         textposition='outside', textfont=dict(size=10)
-    ), row=1, col=1)
+    ), 1, 1))
 
     # 2. Resources Chart (top-right)
-    fig.add_trace(go.Bar(
-        name='CPU (millicores)', x=load_labels, y=df['cpu_millicores'],
-        marker_color=COLORS['primary'], text=df['cpu_millicores'].round(0),
+    traces.append((go.Bar(**UNVALIDATED,
+        name='CPU (millicores)', x=load_labels, y=values['cpu_millicores'],
+        marker_color=COLORS['primary'], text=text_labels(values['cpu_millicores'], 0),
         textposition='outside', textfont=dict(size=10)
-    ), row=1, col=2)
-    fig.add_trace(go.Bar(
-        name='Memory (GB)', x=load_labels, y=df['memory_gb'],
-        marker_color=COLORS['secondary'], text=df['memory_gb'].round(2),
+    ), 1, 2))
+    traces.append((go.Bar(**UNVALIDATED,
+        name='Memory (GB)', x=load_labels, y=values['memory_gb'],
+        marker_color=COLORS['secondary'], text=text_labels(values['memory_gb'], 2),
         textposition='outside', textfont=dict(size=10)
-    ), row=1, col=2)
+    ), 1, 2))
 
     # 3. Bytes Ingested Chart (bottom-left)
-    fig.add_trace(go.Bar(
-        name='Target MB/s', x=load_labels, y=df['mb_per_sec'],
+    traces.append((go.Bar(**UNVALIDATED,
+        name='Target MB/s', x=load_labels, y=values['mb_per_sec'],
         marker_color=COLORS['quaternary'], opacity=0.7
-    ), row=2, col=1)
-    fig.add_trace(go.Bar(
-        name='Actual MB/s', x=load_labels, y=df['mb_per_sec_actual'],
+    ), 2, 1))
+    traces.append((go.Bar(**UNVALIDATED,
+        name='Actual MB/s', x=load_labels, y=values['mb_per_sec_actual'],
         marker_color=COLORS['primary'],
-        text=[f"{(actual/target*100):.0f}%" if target > 0 else "N/A"
-              for actual, target in zip(df['mb_per_sec_actual'], df['mb_per_sec'])],
+        text=[f"{v:.0f}%" if not np.isnan(v) else "N/A"
+              for v in percent_of(values['mb_per_sec_actual'], values['mb_per_sec'], fill=np.nan)],
         textposition='outside', textfont=dict(size=10)
-    ), row=2, col=1)
+    ), 2, 1))
 
     # 4. Errors Chart (bottom-right)
-    fig.add_trace(go.Bar(
-        name='Error Rate (%)', x=load_labels, y=df['error_rate'],
-        marker_color=COLORS['secondary'], text=df['error_rate'].round(2),
+    traces.append((go.Bar(**UNVALIDATED,
+        name='Error Rate (%)', x=load_labels, y=values['error_rate'],
+        marker_color=COLORS['secondary'], text=text_labels(values['error_rate'], 2),
         textposition='outside', textfont=dict(size=10)
-    ), row=2, col=2)
-    fig.add_trace(go.Bar(
-        name='Dropped Spans/sec', x=load_labels, y=df['dropped_spans'],
-        marker_color=COLORS['accent'], text=df['dropped_spans'].round(1),
+    ), 2, 2))
+    traces.append((go.Bar(**UNVALIDATED,
+        name='Dropped Spans/sec', x=load_labels, y=values['dropped_spans'],
+        marker_color=COLORS['accent'], text=text_labels(values['dropped_spans'], 1),
         textposition='outside', textfont=dict(size=10)
-    ), row=2, col=2)
-    fig.add_trace(go.Bar(
-        name='Discarded Spans/sec', x=load_labels, y=df['discarded_spans'],
-        marker_color=COLORS['tertiary'], text=df['discarded_spans'].round(1),
+    ), 2, 2))
+    traces.append((go.Bar(**UNVALIDATED,
+        name='Discarded Spans/sec', x=load_labels, y=values['discarded_spans'],
+        marker_color=COLORS['tertiary'], text=text_labels(values['discarded_spans'], 1),
         textposition='outside', textfont=dict(size=10)
-    ), row=2, col=2)
+    ), 2, 2))
+
+    subtitle = 'Performance Test Dashboard'
+    if len(df) > MAX_BAR_TEXT_LOADS:
+        for bar, _, _ in traces:
+            bar.update(text=None, textposition=None)
+        subtitle += f' (bar values hidden for more than {MAX_BAR_TEXT_LOADS} loads; hover for details)'
+
+    bars, rows, cols = zip(*traces)
+    fig.add_traces(list(bars), rows=list(rows), cols=list(cols))
 
     # Update layout
     fig.update_layout(
         title=dict(
-            text=f'<b>{report_name}</b><br><span style="font-size:16px">Performance Test Dashboard</span>',
+            text=f'<b>{report_name}</b><br><span style="font-size:16px">{subtitle}</span>',
             font=dict(size=24, color=COLORS['text']),
             x=0.5, xanchor='center'
         ),
@@ -1403,36 +1566,62 @@ def generate_interactive_dashboard(df: pd.DataFrame, output_dir: Path, report_na
     )
 
     # Update axes
-    fig.update_xaxes(
-        showgrid=True, gridwidth=1, gridcolor='#333355',
-        tickfont=dict(color=COLORS['text'])
-    )
-    fig.update_yaxes(
-        showgrid=True, gridwidth=1, gridcolor='#333355',
-        tickfont=dict(color=COLORS['text'])
-    )
-
-    # Add axis labels
-    fig.update_yaxes(title_text="Latency (ms)", row=1, col=1)
-    fig.update_yaxes(title_text="CPU (millicores) / Memory (GB)", row=1, col=2)
-    fig.update_yaxes(title_text="MB/sec", row=2, col=1)
-    fig.update_yaxes(title_text="Value", row=2, col=2)
+    fig.update_xaxes(**AXIS_STYLE)
+    fig.update_layout(yaxes_patch([
+        "Latency (ms)", "CPU (millicores) / Memory (GB)", "MB/sec", "Value",
+    ]))
 
     # Save dashboard
     output_path = output_dir / 'dashboard.html'
-    fig.write_html(
-        str(output_path),
-        include_plotlyjs=True,
-        full_html=True,
-        config={
-            'displayModeBar': True,
-            'displaylogo': False,
-            'modeBarButtonsToRemove': ['lasso2d', 'select2d']
-        }
-    )
+    write_dashboard(fig, output_path)
     print(f"  ✅ Created: {output_path}")
 
 
+# Series longer than this are reduced to LTTB_POINTS before being sent to the browser
+LTTB_THRESHOLD = 2000
+LTTB_POINTS = 1500
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Pick n_out point indices with Largest-Triangle-Three-Buckets downsampling.
+
+    The first and last points are always kept; each bucket in between keeps the
+    point forming the largest triangle with the previously kept point and the
+    average of the next bucket, which preserves peaks and the overall shape.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = x.astype(np.float64)
+    y = y.astype(np.float64)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    edges = np.append(edges, n)
+
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_lo, next_hi = edges[i + 1], edges[i + 2]
+        avg_x = x[next_lo:next_hi].mean()
+        avg_y = y[next_lo:next_hi].mean()
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(area.argmax())
+        indices[i + 1] = a
+    return indices
+
+
+def series_xy(load_data: pd.DataFrame, column: str) -> dict[str, np.ndarray]:
+    """Return x (minute) and y trace arguments for a column, downsampled if it is long."""
+    x = load_data['minute'].to_numpy()
+    y = load_data[column].to_numpy()
+    if len(x) > LTTB_THRESHOLD:
+        idx = lttb_indices(x, y, LTTB_POINTS)
+        x, y = x[idx], y[idx]
+    return {'x': x, 'y': y}
+
+
 def generate_timeseries_dashboard(ts_df: pd.DataFrame, output_dir: Path, report_name: str) -> None:
     """Generate interactive HTML dashboard with time-series data."""
     if ts_df.empty:
@@ -1441,7 +1630,7 @@ def generate_timeseries_dashboard(ts_df: pd.DataFrame, output_dir: Path, report_
     
     print("\n🌐 Generating time-series dashboard (HTML)...")
     
-    loads = ts_df['load_name'].unique()
+    groups = {load: load_data for load, load_data in ts_df.groupby('load_name', sort=False)}
     
     # Create subplot figure with 5 rows
     fig = make_subplots(
@@ -1458,118 +1647,105 @@ def generate_timeseries_dashboard(ts_df: pd.DataFrame, output_dir: Path, report_
                [{"secondary_y": False}], [{"secondary_y": True}], [{"secondary_y": False}]]
     )
     
-    # Row 1: Latency metrics
-    for i, load in enumerate(loads):
-        load_data = ts_df[ts_df['load_name'] == load]
+    # (trace, row, col, secondary_y) tuples per subplot row, added to the figure in one call below
+    row_traces: dict[int, list[tuple[go.Scattergl, int, int, bool]]] = {row: [] for row in range(1, 6)}
+
+    for i, (load, load_data) in enumerate(groups.items()):
         color = LOAD_COLORS[i % len(LOAD_COLORS)]
-        
+
+        # Row 1: Latency metrics
         # P99 (solid)
-        fig.add_trace(go.Scatter(
-            x=load_data['minute'], y=load_data['p99_ms'],
+        row_traces[1].append((go.Scattergl(**UNVALIDATED,
+            **series_xy(load_data, 'p99_ms'),
             name=f'{load} P99', mode='lines+markers',
             line=dict(color=color, width=2),
             marker=dict(size=4),
             legendgroup=load,
-        ), row=1, col=1)
+        ), 1, 1, False))
         
         # P90 (dashed)
-        fig.add_trace(go.Scatter(
-            x=load_data['minute'], y=load_data['p90_ms'],
+        row_traces[1].append((go.Scattergl(**UNVALIDATED,
+            **series_xy(load_data, 'p90_ms'),
             name=f'{load} P90', mode='lines',
             line=dict(color=color, width=1.5, dash='dash'),
             legendgroup=load, showlegend=False,
-        ), row=1, col=1)
+        ), 1, 1, False))
         
         # P50 (dotted)
-        fig.add_trace(go.Scatter(
-            x=load_data['minute'], y=load_data['p50_ms'],
+        row_traces[1].append((go.Scattergl(**UNVALIDATED,
+            **series_xy(load_data, 'p50_ms'),
             name=f'{load} P50', mode='lines',
             line=dict(color=color, width=1, dash='dot'),
             legendgroup=load, showlegend=False,
-        ), row=1, col=1)
-    
-    # Row 2: Resource metrics (dual axis)
-    for i, load in enumerate(loads):
-        load_data = ts_df[ts_df['load_name'] == load]
-        color = LOAD_COLORS[i % len(LOAD_COLORS)]
-        
+        ), 1, 1, False))
+
+        # Row 2: Resource metrics (dual axis)
         # CPU (primary y-axis) - in millicores
-        fig.add_trace(go.Scatter(
-            x=load_data['minute'], y=load_data['cpu_millicores'],
+        row_traces[2].append((go.Scattergl(**UNVALIDATED,
+            **series_xy(load_data, 'cpu_millicores'),
             name=f'{load} CPU', mode='lines+markers',
             line=dict(color=color, width=2),
             marker=dict(size=4),
             legendgroup=f'{load}_res',
-        ), row=2, col=1, secondary_y=False)
+        ), 2, 1, False))
         
         # Memory (secondary y-axis)
-        fig.add_trace(go.Scatter(
-            x=load_data['minute'], y=load_data['memory_gb'],
+        row_traces[2].append((go.Scattergl(**UNVALIDATED,
+            **series_xy(load_data, 'memory_gb'),
             name=f'{load} Memory', mode='lines',
             line=dict(color=color, width=2, dash='dash'),
             legendgroup=f'{load}_res', showlegend=False,
-        ), row=2, col=1, secondary_y=True)
-    
-    # Row 3: Bytes Ingested (MB/sec)
-    for i, load in enumerate(loads):
-        load_data = ts_df[ts_df['load_name'] == load]
-        color = LOAD_COLORS[i % len(LOAD_COLORS)]
-        
-        # Convert bytes_per_sec to MB/sec
-        mb_per_sec = load_data['bytes_per_sec'] / (1024 * 1024)
-        
-        fig.add_trace(go.Scatter(
-            x=load_data['minute'], y=mb_per_sec,
+        ), 2, 1, True))
+
+        # Row 3: Bytes Ingested (MB/sec)
+        row_traces[3].append((go.Scattergl(**UNVALIDATED,
+            **series_xy(load_data, 'mb_per_sec_ts'),
             name=f'{load} MB/sec', mode='lines+markers',
             line=dict(color=color, width=2),
             marker=dict(size=4),
-            fill='tozeroy', fillcolor=f'rgba{tuple(list(bytes.fromhex(color[1:])) + [0.1])}',
+            fill='tozeroy', fillcolor=LOAD_FILL_COLORS[i % len(LOAD_FILL_COLORS)],
             legendgroup=f'{load}_tp',
-        ), row=3, col=1)
-    
-    # Row 4: Error metrics (dual axis)
-    for i, load in enumerate(loads):
-        load_data = ts_df[ts_df['load_name'] == load]
-        color = LOAD_COLORS[i % len(LOAD_COLORS)]
-        
+        ), 3, 1, False))
+
+        # Row 4: Error metrics (dual axis)
         # Query failures (primary y-axis)
-        fig.add_trace(go.Scatter(
-            x=load_data['minute'], y=load_data['query_failures'],
+        row_traces[4].append((go.Scattergl(**UNVALIDATED,
+            **series_xy(load_data, 'query_failures'),
             name=f'{load} Failures', mode='lines+markers',
             line=dict(color=color, width=2),
             marker=dict(size=4),
             legendgroup=f'{load}_err',
-        ), row=4, col=1, secondary_y=False)
+        ), 4, 1, False))
         
         # Dropped spans (secondary y-axis)
-        fig.add_trace(go.Scatter(
-            x=load_data['minute'], y=load_data['dropped_spans'],
+        row_traces[4].append((go.Scattergl(**UNVALIDATED,
+            **series_xy(load_data, 'dropped_spans'),
             name=f'{load} Dropped', mode='lines',
             line=dict(color=color, width=2, dash='dash'),
             legendgroup=f'{load}_err', showlegend=False,
-        ), row=4, col=1, secondary_y=True)
+        ), 4, 1, True))
         
         # Discarded spans (tertiary y-axis - using different dash pattern)
-        fig.add_trace(go.Scatter(
-            x=load_data['minute'], y=load_data['discarded_spans'],
+        row_traces[4].append((go.Scattergl(**UNVALIDATED,
+            **series_xy(load_data, 'discarded_spans'),
             name=f'{load} Discarded', mode='lines',
             line=dict(color=color, width=2, dash='dot'),
             legendgroup=f'{load}_err', showlegend=False,
-        ), row=4, col=1, secondary_y=True)
-    
-    # Row 5: Average Spans Returned per Query
-    for i, load in enumerate(loads):
-        load_data = ts_df[ts_df['load_name'] == load]
-        color = LOAD_COLORS[i % len(LOAD_COLORS)]
-        
-        fig.add_trace(go.Scatter(
-            x=load_data['minute'], y=load_data['avg_spans_returned'],
+        ), 4, 1, True))
+
+        # Row 5: Average Spans Returned per Query
+        row_traces[5].append((go.Scattergl(**UNVALIDATED,
+            **series_xy(load_data, 'avg_spans_returned'),
             name=f'{load} Spans Returned', mode='lines+markers',
             line=dict(color=color, width=2),
             marker=dict(size=4),
             legendgroup=f'{load}_sr',
-        ), row=5, col=1)
-    
+        ), 5, 1, False))
+
+    traces = [trace for row in sorted(row_traces) for trace in row_traces[row]]
+    lines, rows, cols, secondary_ys = zip(*traces)
+    fig.add_traces(list(lines), rows=list(rows), cols=list(cols), secondary_ys=list(secondary_ys))
+
     # Update layout
     fig.update_layout(
         title=dict(
@@ -1597,37 +1773,19 @@ def generate_timeseries_dashboard(ts_df: pd.DataFrame, output_dir: Path, report_
     )
     
     # Update axes
-    fig.update_xaxes(
-        showgrid=True, gridwidth=1, gridcolor='#333355',
-        tickfont=dict(color=COLORS['text']),
-        title_text="Time (minutes)", row=5, col=1
-    )
-    fig.update_yaxes(
-        showgrid=True, gridwidth=1, gridcolor='#333355',
-        tickfont=dict(color=COLORS['text'])
-    )
-    
-    # Add axis labels
-    fig.update_yaxes(title_text="Latency (ms)", row=1, col=1)
-    fig.update_yaxes(title_text="CPU (millicores)", row=2, col=1, secondary_y=False)
-    fig.update_yaxes(title_text="Memory (GB)", row=2, col=1, secondary_y=True)
-    fig.update_yaxes(title_text="MB/sec", row=3, col=1)
-    fig.update_yaxes(title_text="Failures/sec", row=4, col=1, secondary_y=False)
-    fig.update_yaxes(title_text="Dropped/Discarded/sec", row=4, col=1, secondary_y=True)
-    fig.update_yaxes(title_text="Avg Spans", row=5, col=1)
+    fig.update_xaxes(**AXIS_STYLE, title_text="Time (minutes)", row=5, col=1)
+    # Secondary y axes follow their primary axis in subplot order
+    fig.update_layout(yaxes_patch([
+        "Latency (ms)",
+        "CPU (millicores)", "Memory (GB)",
+        "MB/sec",
+        "Failures/sec", "Dropped/Discarded/sec",
+        "Avg Spans",
+    ]))
     
     # Save dashboard
     output_path = output_dir / 'timeseries-dashboard.html'
-    fig.write_html(
-        str(output_path),
-        include_plotlyjs=True,
-        full_html=True,
-        config={
-            'displayModeBar': True,
-            'displaylogo': False,
-            'modeBarButtonsToRemove': ['lasso2d', 'select2d']
-        }
-    )
+    write_dashboard(fig, output_path)
     print(f"  ✅ Created: {output_path}")
 
 
@@ -1635,10 +1793,54 @@ def generate_timeseries_dashboard(ts_df: pd.DataFrame, output_dir: Path, report_
 # Summary Table Generation
 # =============================================================================
 
+def summary_row_html(row: Any) -> str:
+    """Render one summary table row from a results_to_dataframe() itertuples row."""
+    eff_class = 'metric-good' if row.efficiency >= 90 else ('metric-warn' if row.efficiency >= 70 else 'metric-bad')
+    err_class = 'metric-good' if row.error_rate < 1 else ('metric-warn' if row.error_rate < 5 else 'metric-bad')
+    qps_eff_class = ''
+    if row.target_qps > 0:
+        qps_eff_class = 'metric-good' if row.qps_efficiency >= 90 else ('metric-warn' if row.qps_efficiency >= 70 else 'metric-bad')
+    
+    # Format target QPS
+    target_qps_str = f"{row.target_qps:.1f}" if row.target_qps > 0 else 'N/A'
+
+    return f"""                <tr>
+                    <td><strong>{row.load_name}</strong></td>
+                    <td>{row.mb_per_sec:.1f}</td>
+                    <td>{row.mb_per_sec_actual:.2f}</td>
+                    <td>{row.gb_per_day:.1f}</td>
+                    <td>{row.p50_ms:.1f}</td>
+                    <td>{row.p90_ms:.1f}</td>
+                    <td>{row.p99_ms:.1f}</td>
+                    <td>{row.avg_latency_ms:.1f}</td>
+                    <td>{row.cpu_millicores:.0f}</td>
+                    <td>{row.max_cpu_millicores:.0f}</td>
+                    <td>{row.min_cpu_millicores:.0f}</td>
+                    <td>{row.avg_memory_gb:.2f}</td>
+                    <td>{row.max_memory_gb:.2f}</td>
+                    <td>{row.min_memory_gb:.2f}</td>
+                    <td>{row.sustained_cpu_millicores:.0f}</td>
+                    <td>{row.peak_memory_gb:.2f} GB</td>
+                    <td class="metric-rec">{row.recommended_cpu_millicores:.0f}</td>
+                    <td class="metric-rec">{row.recommended_memory_gb:.1f} GB</td>
+                    <td>{row.spans_per_sec:.0f}</td>
+                    <td class="{eff_class}">{row.efficiency:.1f}%</td>
+                    <td class="{err_class}">{row.error_rate:.2f}%</td>
+                    <td>{row.dropped_spans:.2f}</td>
+                    <td>{row.discarded_spans:.2f}</td>
+                    <td>{target_qps_str}</td>
+                    <td class="{qps_eff_class}">{row.actual_qps:.2f}</td>
+                </tr>
+"""
+
+
 def generate_summary_table(df: pd.DataFrame, output_dir: Path, report_name: str) -> None:
     """Generate an HTML summary table of results."""
     print("\n📋 Generating summary table...")
 
+    # Columns are added below; the caller's frame may still be queued for chart workers
+    df = df.copy()
+
     # Ensure new resource metric columns exist (for backward compatibility)
     if 'max_cpu_cores' not in df.columns:
         df['max_cpu_cores'] = 0
@@ -1655,18 +1857,12 @@ def generate_summary_table(df: pd.DataFrame, output_dir: Path, report_name: str)
         df['min_memory_gb'] = 0
 
     # Calculate efficiency based on target vs actual MB/s
-    df['efficiency'] = df.apply(
-        lambda row: (row['mb_per_sec_actual'] / row['mb_per_sec'] * 100) if row['mb_per_sec'] > 0 else 0,
-        axis=1
-    ).round(1)
-    
+    df['efficiency'] = np.round(percent_of(df['mb_per_sec_actual'], df['mb_per_sec']), 1)
+
     # Calculate QPS efficiency (target vs actual)
-    df['qps_efficiency'] = df.apply(
-        lambda row: (row['actual_qps'] / row['target_qps'] * 100) if row['target_qps'] > 0 else 0,
-        axis=1
-    ).round(1)
+    df['qps_efficiency'] = np.round(percent_of(df['actual_qps'], df['target_qps']), 1)
 
-    html_content = f"""<!DOCTYPE html>
+    header = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -1773,46 +1969,7 @@ def generate_summary_table(df: pd.DataFrame, output_dir: Path, report_name: str)
             <tbody>
 """
 
-    for _, row in df.iterrows():
-        eff_class = 'metric-good' if row['efficiency'] >= 90 else ('metric-warn' if row['efficiency'] >= 70 else 'metric-bad')
-        err_class = 'metric-good' if row['error_rate'] < 1 else ('metric-warn' if row['error_rate'] < 5 else 'metric-bad')
-        qps_eff_class = ''
-        if row['target_qps'] > 0:
-            qps_eff_class = 'metric-good' if row['qps_efficiency'] >= 90 else ('metric-warn' if row['qps_efficiency'] >= 70 else 'metric-bad')
-        
-        # Format target QPS
-        target_qps_str = f"{row['target_qps']:.1f}" if row['target_qps'] > 0 else 'N/A'
-
-        html_content += f"""                <tr>
-                    <td><strong>{row['load_name']}</strong></td>
-                    <td>{row['mb_per_sec']:.1f}</td>
-                    <td>{row['mb_per_sec_actual']:.2f}</td>
-                    <td>{row['gb_per_day']:.1f}</td>
-                    <td>{row['p50_ms']:.1f}</td>
-                    <td>{row['p90_ms']:.1f}</td>
-                    <td>{row['p99_ms']:.1f}</td>
-                    <td>{row['avg_latency_ms']:.1f}</td>
-                    <td>{row['cpu_millicores']:.0f}</td>
-                    <td>{row['max_cpu_millicores']:.0f}</td>
-                    <td>{row['min_cpu_millicores']:.0f}</td>
-                    <td>{row['avg_memory_gb']:.2f}</td>
-                    <td>{row['max_memory_gb']:.2f}</td>
-                    <td>{row['min_memory_gb']:.2f}</td>
-                    <td>{row['sustained_cpu_millicores']:.0f}</td>
-                    <td>{row['peak_memory_gb']:.2f} GB</td>
-                    <td class="metric-rec">{row['recommended_cpu_millicores']:.0f}</td>
-                    <td class="metric-rec">{row['recommended_memory_gb']:.1f} GB</td>
-                    <td>{row['spans_per_sec']:.0f}</td>
-                    <td class="{eff_class}">{row['efficiency']:.1f}%</td>
-                    <td class="{err_class}">{row['error_rate']:.2f}%</td>
-                    <td>{row['dropped_spans']:.2f}</td>
-                    <td>{row['discarded_spans']:.2f}</td>
-                    <td>{target_qps_str}</td>
-                    <td class="{qps_eff_class}">{row['actual_qps']:.2f}</td>
-                </tr>
-"""
-
-    html_content += """            </tbody>
+    footer = """            </tbody>
         </table>
         <p class="footer">Generated by Tempo Performance Test Framework (Resource recommendations include 20% safety margin)</p>
     </div>
@@ -1820,9 +1977,13 @@ def generate_summary_table(df: pd.DataFrame, output_dir: Path, report_name: str)
 </html>
 """
 
+    # Rows are written as they are formatted instead of building the whole page in memory
     output_path = output_dir / 'summary.html'
-    with open(output_path, 'w') as f:
-        f.write(html_content)
+    with output_path.open('w', encoding='utf-8', buffering=1024 * 1024) as f:
+        f.write(header)
+        for row in df.itertuples(index=False):
+            f.write(summary_row_html(row))
+        f.write(footer)
     print(f"  ✅ Created: {output_path}")
 
 
@@ -2135,8 +2296,7 @@ def generate_per_container_report(results: list[dict[str, Any]], output_dir: Pat
 """
     
     output_path = output_dir / 'per-container-report.html'
-    with open(output_path, 'w') as f:
-        f.write(html_content)
+    output_path.write_bytes(html_content.encode('utf-8'))
     print(f"  ✅ Created: {output_path}")
     
     # Generate CSV report (select relevant columns, excluding pod total columns)
@@ -2173,6 +2333,10 @@ def main():
         print(f"Error: Results directory not found: {results_dir}")
         sys.exit(1)
 
+    if PLOTLYJS not in PLOTLYJS_MODES:
+        print(f"Error: Unknown CHART_PLOTLYJS value '{PLOTLYJS}' (expected one of: {', '.join(PLOTLYJS_MODES)})")
+        sys.exit(1)
+
     print("=" * 60)
     print("  Tempo Performance Test - Chart Generation")
     print("=" * 60)
@@ -2197,13 +2361,21 @@ def main():
     else:
         print("No time-series data found (legacy format)")
 
-    # Generate outputs
-    generate_static_charts(df, results_dir, report_name, timestamp)
-    generate_timeseries_charts(ts_df, results_dir, report_name, timestamp, results)
-    generate_interactive_dashboard(df, results_dir, report_name)
-    generate_timeseries_dashboard(ts_df, results_dir, report_name)
-    generate_summary_table(df, results_dir, report_name)
-    generate_per_container_report(results, results_dir, report_name)
+    # Generate outputs, grouped by the frame they read so each can be freed afterwards.
+    # PNG charts render in worker processes while the HTML outputs are built here.
+    with chart_pool() as pool:
+        pending = generate_static_charts(df, results_dir, report_name, timestamp, pool)
+        generate_interactive_dashboard(df, results_dir, report_name)
+        generate_summary_table(df, results_dir, report_name)
+        # Queued charts keep the summary frame alive until they have rendered
+        wait_for_charts(pending)
+        del df, pending
+        gc.collect()
+
+        pending = generate_timeseries_charts(ts_df, results_dir, report_name, timestamp, pool, results)
+        generate_timeseries_dashboard(ts_df, results_dir, report_name)
+        generate_per_container_report(results, results_dir, report_name)
+        wait_for_charts(pending)
 
     print("\n" + "=" * 60)
     print("  Chart generation complete!")
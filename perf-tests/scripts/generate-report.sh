@@ -511,7 +511,7 @@ generate_charts() {
     fi
     
     # Check for required Python modules
-    if ! python3 -c "import matplotlib, plotly, pandas" 2>/dev/null; then
+    if ! python3 -c "import matplotlib, plotly, pandas, orjson" 2>/dev/null; then
         log_warn "Python chart dependencies not installed. Skipping chart generation."
         log_warn "To enable charts, run: pip install -r ${PERF_TESTS_DIR}/requirements.txt"
         return 0